@@ -5,6 +5,7 @@ Enhanced with comprehensive observability and execution tracking.
 import streamlit as st
 from datetime import datetime
 import json
+import os
 
 from helpers.graph import graph
 from helpers.observability import LLMCallTracker, ExecutionTracker
@@ -108,7 +109,20 @@ if st.session_state.processing and st.session_state.workflow_result is None:
             step_count = 0
             max_steps = 35  # Estimate
 
-            for event in graph.stream(initial_state, config=config, stream_mode="updates"):
+            # "custom" carries LLM chunks streamed by the processors
+            live_output = st.empty()
+            streamed_text = ""
+
+            for mode, event in graph.stream(initial_state, config=config, stream_mode=["updates", "custom"]):
+                if mode == "custom":
+                    streamed_text += event.get("chunk", "")
+                    live_output.markdown(f"**{event.get('node')}** (streaming)\n\n{streamed_text}")
+                    continue
+
+                # A node finished; clear its live output
+                streamed_text = ""
+                live_output.empty()
+
                 step_count += 1
                 progress = min(step_count / max_steps, 0.95)  # Cap at 95% until complete
                 progress_bar.progress(progress)
@@ -364,14 +378,13 @@ if st.session_state.workflow_result is not None:
     with tabs[6]:
         st.subheader("Markdown Report")
 
-        # Find the markdown report in messages
-        messages = result.get("messages", [])
+        # Load the markdown report written by markdown_writer
         markdown_content = None
+        report_path = result.get("report_path")
 
-        for msg in reversed(messages):  # Start from most recent
-            if hasattr(msg, 'name') and msg.name == "markdown_writer":
-                markdown_content = msg.content
-                break
+        if report_path and os.path.exists(report_path):
+            with open(report_path, 'r') as f:
+                markdown_content = f.read()
 
         if markdown_content:
             # Display the report
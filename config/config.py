@@ -31,5 +31,11 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 ANTHROPIC_MODEL = os.getenv("ANTHROPIC_MODEL", "claude-3-5-sonnet-20241022")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")
 
+# Smaller models for classification and one-line next actions
+# (Ollama runs locally, so it reuses OLLAMA_MODEL unless one is set)
+ANTHROPIC_SMALL_MODEL = os.getenv("ANTHROPIC_SMALL_MODEL", "claude-3-5-haiku-20241022")
+OPENAI_SMALL_MODEL = os.getenv("OPENAI_SMALL_MODEL", "gpt-4o-mini")
+OLLAMA_SMALL_MODEL = os.getenv("OLLAMA_SMALL_MODEL", OLLAMA_MODEL)
+
 # Output Configuration
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "output")
@@ -3,31 +3,49 @@ Centralized model factory for creating LLM instances.
 Supports Anthropic, OpenAI, and Ollama providers.
 Includes LLM call tracking for observability.
 """
-from typing import Optional
+from typing import Literal, Optional
 from datetime import datetime
+from functools import lru_cache
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from config.config import (
     LLM_PROVIDER,
     ANTHROPIC_API_KEY,
     ANTHROPIC_MODEL,
+    ANTHROPIC_SMALL_MODEL,
     OPENAI_API_KEY,
     OPENAI_MODEL,
+    OPENAI_SMALL_MODEL,
     OLLAMA_MODEL,
+    OLLAMA_SMALL_MODEL,
     OLLAMA_BASE_URL,
 )
 
 # Global flag for tracking (can be disabled for production)
 ENABLE_LLM_TRACKING = True
 
+ModelSize = Literal["small", "large"]
 
-def get_chat_model(temperature: float = 0.3, model_override: Optional[str] = None) -> BaseChatModel:
+
+@lru_cache(maxsize=16)
+def get_chat_model(
+    temperature: float = 0.3,
+    model_override: Optional[str] = None,
+    size: ModelSize = "large"
+) -> BaseChatModel:
     """
     Creates and returns a chat model instance based on the configured provider.
 
+    Instances are memoized per argument combination, so every call with the
+    same settings reuses one provider client and its pooled keep-alive
+    connections instead of opening new HTTPS connections.
+
     Args:
         temperature: Temperature parameter for the model (default: 0.3)
         model_override: Optional model name to override the default from config
+        size: "large" (default) uses the provider's main model; "small" uses its
+            small model (e.g. for classification and next actions).
+            Ignored when model_override is given.
 
     Returns:
         BaseChatModel: An instance of the appropriate chat model
@@ -37,6 +55,13 @@ def get_chat_model(temperature: float = 0.3, model_override: Optional[str] = Non
     """
     provider = LLM_PROVIDER.lower()
 
+    if size not in ("small", "large"):
+        raise ValueError(
+            f"Unsupported model size: {size}. "
+            f"Please use 'small' or 'large'."
+        )
+    small = size == "small"
+
     if provider == "anthropic":
         if not ANTHROPIC_API_KEY:
             raise ValueError(
@@ -45,7 +70,7 @@ def get_chat_model(temperature: float = 0.3, model_override: Optional[str] = Non
 
         from langchain_anthropic import ChatAnthropic
 
-        model_name = model_override or ANTHROPIC_MODEL
+        model_name = model_override or (ANTHROPIC_SMALL_MODEL if small else ANTHROPIC_MODEL)
         return ChatAnthropic(
             model=model_name,
             temperature=temperature,
@@ -60,7 +85,7 @@ def get_chat_model(temperature: float = 0.3, model_override: Optional[str] = Non
 
         from langchain_openai import ChatOpenAI
 
-        model_name = model_override or OPENAI_MODEL
+        model_name = model_override or (OPENAI_SMALL_MODEL if small else OPENAI_MODEL)
         return ChatOpenAI(
             model=model_name,
             temperature=temperature,
@@ -70,7 +95,7 @@ def get_chat_model(temperature: float = 0.3, model_override: Optional[str] = Non
     elif provider == "ollama":
         from langchain_ollama import ChatOllama
 
-        model_name = model_override or OLLAMA_MODEL
+        model_name = model_override or (OLLAMA_SMALL_MODEL if small else OLLAMA_MODEL)
         return ChatOllama(
             model=model_name,
             temperature=temperature,
@@ -84,11 +109,24 @@ def get_chat_model(temperature: float = 0.3, model_override: Optional[str] = Non
         )
 
 
+def supports_prompt_caching() -> bool:
+    """
+    Whether the configured provider honors explicit cache_control blocks.
+
+    Only Anthropic takes cache_control markers; OpenAI caches long prompt
+    prefixes automatically and Ollama runs locally, so neither needs them.
+
+    Returns:
+        True if prompts should mark their static prefix with cache_control
+    """
+    return LLM_PROVIDER.lower() == "anthropic"
+
+
 class TrackedChatModel:
     """
     Wrapper for BaseChatModel that tracks LLM calls for observability.
 
-    This wrapper intercepts invoke() calls and records:
+    This wrapper intercepts invoke()/stream()/batch() calls and records:
     - Timing information
     - Prompt and response lengths
     - Model configuration
@@ -141,55 +179,149 @@ class TrackedChatModel:
         try:
             # Make the actual LLM call
             response = self.model.invoke(prompt, **kwargs)
+        except Exception as e:
+            self._record_failure(start_time, prompt_length)
+            # Re-raise the original exception
+            raise e
 
-            # Calculate duration
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
-
-            # Get response length
-            response_text = response.content if hasattr(response, 'content') else str(response)
-            response_length = len(response_text)
-
-            # Record the call
-            try:
-                from helpers.observability import LLMCallTracker
-                LLMCallTracker.record_call(
-                    node_name=self.node_name,
-                    model_name=self._model_name,
-                    temperature=self._temperature,
-                    prompt_length=prompt_length,
-                    response_length=response_length,
-                    duration_seconds=duration,
-                    purpose=self.purpose
-                )
-            except Exception as e:
-                # Don't fail the LLM call if tracking fails
-                print(f"Warning: Failed to record LLM call: {e}")
-
-            return response
+        self._record_success(start_time, prompt_length, response)
+        return response
 
+    def stream(self, prompt, **kwargs):
+        """
+        Stream the model's response and track the call once it completes.
+
+        Args:
+            prompt: The prompt to send to the model
+            **kwargs: Additional arguments to pass to model.stream()
+
+        Yields:
+            Response chunks as they arrive
+        """
+        if not ENABLE_LLM_TRACKING:
+            # Tracking disabled, just pass through
+            yield from self.model.stream(prompt, **kwargs)
+            return
+
+        # Track the call
+        start_time = datetime.now()
+        prompt_length = len(str(prompt)) if prompt else 0
+        parts = []
+
+        try:
+            for chunk in self.model.stream(prompt, **kwargs):
+                parts.append(chunk.content if hasattr(chunk, 'content') else str(chunk))
+                yield chunk
         except Exception as e:
-            # Record failed call
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
-
-            try:
-                from helpers.observability import LLMCallTracker
-                LLMCallTracker.record_call(
-                    node_name=self.node_name,
-                    model_name=self._model_name,
-                    temperature=self._temperature,
-                    prompt_length=prompt_length,
-                    response_length=0,
-                    duration_seconds=duration,
-                    purpose=f"{self.purpose} (FAILED)"
-                )
-            except:
-                pass
+            self._record_failure(start_time, prompt_length)
+            # Re-raise the original exception
+            raise e
+
+        self._record_success(start_time, prompt_length, "".join(parts))
 
+    def batch(self, prompts: list, config=None, **kwargs) -> list:
+        """
+        Invoke the model on several prompts in one batched dispatch and track each call.
+
+        Args:
+            prompts: List of prompts to send to the model
+            config: Optional runnable config (e.g. {"max_concurrency": 10})
+            **kwargs: Additional arguments to pass to model.batch()
+                (e.g. return_exceptions=True)
+
+        Returns:
+            List of model responses, in prompt order
+        """
+        if not ENABLE_LLM_TRACKING:
+            # Tracking disabled, just pass through
+            return self.model.batch(prompts, config=config, **kwargs)
+
+        # Track the calls (durations are for the whole batch)
+        start_time = datetime.now()
+
+        try:
+            responses = self.model.batch(prompts, config=config, **kwargs)
+        except Exception as e:
+            for prompt in prompts:
+                self._record_failure(start_time, len(str(prompt)) if prompt else 0)
             # Re-raise the original exception
             raise e
 
+        for prompt, response in zip(prompts, responses):
+            prompt_length = len(str(prompt)) if prompt else 0
+            if isinstance(response, Exception):
+                self._record_failure(start_time, prompt_length)
+            else:
+                self._record_success(start_time, prompt_length, response)
+
+        return responses
+
+    def _record_success(self, start_time: datetime, prompt_length: int, response) -> None:
+        """Record a completed LLM call with the tracker."""
+        # Calculate duration
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+
+        # Get response length
+        response_text = response.content if hasattr(response, 'content') else str(response)
+        response_length = len(response_text)
+
+        # Record the call
+        try:
+            from helpers.observability import LLMCallTracker
+            LLMCallTracker.record_call(
+                node_name=self.node_name,
+                model_name=self._model_name,
+                temperature=self._temperature,
+                prompt_length=prompt_length,
+                response_length=response_length,
+                duration_seconds=duration,
+                purpose=self.purpose
+            )
+        except Exception as e:
+            # Don't fail the LLM call if tracking fails
+            print(f"Warning: Failed to record LLM call: {e}")
+
+    def _record_failure(self, start_time: datetime, prompt_length: int) -> None:
+        """Record a failed LLM call with the tracker."""
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+
+        try:
+            from helpers.observability import LLMCallTracker
+            LLMCallTracker.record_call(
+                node_name=self.node_name,
+                model_name=self._model_name,
+                temperature=self._temperature,
+                prompt_length=prompt_length,
+                response_length=0,
+                duration_seconds=duration,
+                purpose=f"{self.purpose} (FAILED)"
+            )
+        except:
+            pass
+
+    def with_structured_output(self, schema, **kwargs) -> "TrackedChatModel":
+        """
+        Bind a structured output schema while keeping call tracking.
+
+        Args:
+            schema: Pydantic model (or JSON schema) describing the output
+            **kwargs: Additional arguments to pass to model.with_structured_output()
+
+        Returns:
+            TrackedChatModel wrapping the structured-output runnable
+        """
+        tracked = TrackedChatModel(
+            self.model.with_structured_output(schema, **kwargs),
+            node_name=self.node_name,
+            purpose=self.purpose
+        )
+        # The bound runnable has no model_name/temperature of its own
+        tracked._model_name = self._model_name
+        tracked._temperature = self._temperature
+        return tracked
+
     def __getattr__(self, name):
         """Delegate all other attributes to the wrapped model."""
         return getattr(self.model, name)
@@ -199,7 +331,8 @@ def get_tracked_chat_model(
     node_name: str,
     temperature: float = 0.3,
     model_override: Optional[str] = None,
-    purpose: Optional[str] = None
+    purpose: Optional[str] = None,
+    size: ModelSize = "large"
 ) -> TrackedChatModel:
     """
     Creates a tracked chat model instance with LLM call monitoring.
@@ -209,6 +342,7 @@ def get_tracked_chat_model(
         temperature: Temperature parameter for the model (default: 0.3)
         model_override: Optional model name to override the default from config
         purpose: Purpose of the LLM call (e.g., "routing_decision", "task_processing")
+        size: "large" (default) or "small" (see get_chat_model)
 
     Returns:
         TrackedChatModel: Wrapped model instance with call tracking
@@ -217,5 +351,9 @@ def get_tracked_chat_model(
         model = get_tracked_chat_model(node_name="executor", temperature=0.2, purpose="routing")
         response = model.invoke(prompt)
     """
-    base_model = get_chat_model(temperature=temperature, model_override=model_override)
+    base_model = get_chat_model(
+        temperature=temperature,
+        model_override=model_override,
+        size=size
+    )
     return TrackedChatModel(base_model, node_name=node_name, purpose=purpose)
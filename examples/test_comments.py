@@ -87,22 +87,21 @@ def example_4_fetch_from_todays_tasks():
     print("Example 4: Fetch comments for today's tasks")
     print("=" * 60)
 
-    from datetime import datetime
+    from datetime import date
     from todoist_api_python.api import TodoistAPI
     from config.config import TODOIST_API_TOKEN
 
     try:
         api = TodoistAPI(TODOIST_API_TOKEN)
         all_tasks = api.get_tasks()
-        today = datetime.now().date()
+        # YYYY-MM-DD strings sort chronologically, so no date parsing is needed
+        today = date.today().isoformat()
 
         # Get today's tasks
         today_tasks = []
         for task in all_tasks:
-            if task.due and task.due.date:
-                task_date = datetime.strptime(task.due.date, "%Y-%m-%d").date()
-                if task_date <= today:
-                    today_tasks.append(task)
+            if task.due and task.due.date and task.due.date[:10] <= today:
+                today_tasks.append(task)
 
         print(f"\nFound {len(today_tasks)} tasks for today")
 
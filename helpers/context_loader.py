@@ -3,6 +3,7 @@ Context File Loader
 Discovers and loads context files for tasks based on description keywords.
 """
 import os
+from functools import lru_cache
 from typing import Dict, Optional, List, Tuple
 
 
@@ -36,6 +37,12 @@ def find_context_file(task: dict) -> Optional[str]:
         task = {"content": "Create meal planning for next week"}
         path = find_context_file(task)  # Returns "contexts/meal_planning.md"
     """
+    match = _match_context_file(task)
+    return match[1] if match else None
+
+
+def _match_context_file(task: dict) -> Optional[Tuple[str, str]]:
+    """Find a task's context file; returns (filename, path) or None."""
     # Get task text to search (content + description)
     task_content = task.get("content", "").lower()
     task_description = task.get("description", "").lower()
@@ -49,12 +56,12 @@ def find_context_file(task: dict) -> Optional[str]:
 
                 # Only return if file actually exists
                 if os.path.exists(context_path):
-                    return context_path
+                    return context_filename, context_path
 
     return None
 
 
-def load_context_for_task(task: dict) -> Tuple[Optional[str], Optional[str]]:
+def load_context_for_task(task: dict) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
     Find and load context file content for a task.
 
@@ -62,27 +69,36 @@ def load_context_for_task(task: dict) -> Tuple[Optional[str], Optional[str]]:
         task: Task dictionary
 
     Returns:
-        Tuple of (context_file_path, context_content)
-        Returns (None, None) if no context file found
+        Tuple of (context_file_path, context_filename, context_content)
+        Returns (None, None, None) if no context file found
 
     Example:
-        path, content = load_context_for_task(task)
+        path, filename, content = load_context_for_task(task)
         if content:
-            print(f"Loaded context from {path}")
+            print(f"Loaded context from {filename}")
     """
-    context_path = find_context_file(task)
+    match = _match_context_file(task)
+
+    if not match:
+        return None, None, None
 
-    if not context_path:
-        return None, None
+    context_filename, context_path = match
 
     try:
-        with open(context_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return context_path, content
+        # mtime in the key means an edited context file is re-read
+        content = _read_context_file(context_path, os.stat(context_path).st_mtime_ns)
+        return context_path, context_filename, content
     except Exception as e:
         # Return error message as content so worker knows what happened
         error_msg = f"Error reading context file {context_path}: {str(e)}"
-        return context_path, error_msg
+        return context_path, context_filename, error_msg
+
+
+@lru_cache(maxsize=32)
+def _read_context_file(context_path: str, mtime_ns: int) -> str:
+    """Read a context file; memoized per (path, modification time)."""
+    with open(context_path, 'r', encoding='utf-8') as f:
+        return f.read()
 
 
 def load_context_file(context_path: str) -> Optional[str]:
@@ -134,6 +150,7 @@ def get_available_contexts() -> Dict[str, str]:
     return contexts
 
 
+@lru_cache(maxsize=32)
 def format_context_for_prompt(context_content: str, context_name: str = "Context") -> str:
     """
     Format context content for inclusion in LLM prompts.
@@ -194,10 +211,10 @@ if __name__ == "__main__":
     print("-" * 50)
 
     # Find context
-    path, content = load_context_for_task(test_task)
+    path, filename, content = load_context_for_task(test_task)
 
     if path:
-        print(f"✓ Found context: {os.path.basename(path)}")
+        print(f"✓ Found context: {filename}")
         print(f"  Content length: {len(content)} characters")
         print(f"\nFormatted for prompt:")
         print(format_context_for_prompt(content, "meal_planning"))
@@ -4,16 +4,18 @@ Routes between workers based on plan and current state.
 Supports both linear plan execution and intelligent task-loop routing.
 Includes comprehensive observability and decision tracking.
 """
-import json
 from datetime import datetime
 from typing import Literal, Union
 from langchain_core.messages import HumanMessage
 from langgraph.types import Command
 
+from config.model_factory import get_tracked_chat_model
 from helpers.state import State
 from helpers.observability import RoutingDecision, ExecutionTracker
-from prompts.agent_descriptions import format_agent_guidelines_for_executor
+from helpers.json_parsing import extract_json_object
+from prompts.agent_descriptions import get_workflow_context
 from prompts.templates import get_executor_prompt, get_task_loop_executor_prompt
+from workers.batch_processor import group_tasks_for_batch
 
 
 # Maximum replan attempts per step
@@ -46,6 +48,7 @@ def executor_node(state: State) -> Command[Union[
     Literal["research_processor"],
     Literal["next_action_processor"],
     Literal["learning_processor"],
+    Literal["batch_processor"],
     Literal["planning_processor"],
     Literal["markdown_writer"],
     Literal["planner"],
@@ -93,7 +96,7 @@ def executor_node(state: State) -> Command[Union[
         )
 
     # Check if we've completed all steps
-    if str(current_step) not in plan:
+    if current_step not in plan:
         # All steps complete
         completion_message = HumanMessage(
             content="All plan steps completed. Workflow finished.",
@@ -105,7 +108,7 @@ def executor_node(state: State) -> Command[Union[
         )
 
     # Get current step info
-    step_info = plan.get(str(current_step), {})
+    step_info = plan.get(current_step, {})
     planned_agent = step_info.get("agent", "unknown")
 
     # CHECK IF WE'RE IN TASK-LOOP MODE
@@ -153,6 +156,21 @@ def handle_task_loop(state: State, executor_invocations: int) -> Command:
             goto="executor"
         )
 
+    # Send all pending tasks through one batched run before the per-task loop;
+    # tasks it completes are skipped below without a routing LLM call
+    if not state.get("batch_processing_done") and group_tasks_for_batch(state):
+        batch_message = HumanMessage(
+            content="→ Batch processing all pending tasks before the task loop.",
+            name="executor"
+        )
+        return Command(
+            update=_add_executor_counter({
+                "messages": [batch_message],
+                "batch_processing_done": True,
+            }, executor_invocations),
+            goto="batch_processor"
+        )
+
     # Get current task
     current_task = todoist_tasks[current_task_index]
     task_id = current_task['id']
@@ -173,11 +191,7 @@ def handle_task_loop(state: State, executor_invocations: int) -> Command:
             goto="executor"
         )
 
-    # Initialize history for this task if needed
-    if task_id not in task_processing_history:
-        task_processing_history[task_id] = []
-
-    processing_history = task_processing_history[task_id]
+    processing_history = task_processing_history.get(task_id, [])
 
     # SAFEGUARD: Check if task has exceeded maximum processing attempts
     if len(processing_history) >= MAX_PROCESSING_ATTEMPTS_PER_TASK:
@@ -186,15 +200,13 @@ def handle_task_loop(state: State, executor_invocations: int) -> Command:
                     f"(max: {MAX_PROCESSING_ATTEMPTS_PER_TASK}). Forcing completion to prevent infinite loop.",
             name="executor"
         )
-        task_completion_status[task_id] = True
-        
+
         return Command(
             update=_add_executor_counter({
                 "messages": [force_completion_message],
                 "current_task_index": current_task_index + 1,
                 "current_task_id": None,
-                "task_completion_status": task_completion_status,
-                "task_processing_history": task_processing_history,
+                "task_completion_status": {task_id: True},
             }, executor_invocations),
             goto="executor"
         )
@@ -218,10 +230,8 @@ def handle_task_loop(state: State, executor_invocations: int) -> Command:
             mode="task_loop"
         )
 
-        from config.model_factory import get_tracked_chat_model
-
         # Get agent guidelines
-        agent_guidelines = format_agent_guidelines_for_executor(enabled_agents)
+        agent_guidelines = get_workflow_context(tuple(enabled_agents)).executor_guidelines
 
         # Calculate tasks remaining
         tasks_remaining = len(todoist_tasks) - current_task_index
@@ -246,14 +256,7 @@ def handle_task_loop(state: State, executor_invocations: int) -> Command:
         response_text = response.content if hasattr(response, 'content') else str(response)
 
         # Parse JSON response
-        json_start = response_text.find("{")
-        json_end = response_text.rfind("}") + 1
-
-        if json_start >= 0 and json_end > json_start:
-            json_str = response_text[json_start:json_end]
-            decision = json.loads(json_str)
-        else:
-            raise ValueError("No valid JSON found in executor response")
+        decision = extract_json_object(response_text, source="executor")
 
         # Extract decision fields
         goto_worker = decision.get("goto", "task_complete")
@@ -274,20 +277,16 @@ def handle_task_loop(state: State, executor_invocations: int) -> Command:
             is_task_complete=is_complete
         )
 
-        # Get or initialize executor decisions list
-        executor_decisions = state.get("executor_decisions", [])
-        executor_decisions.append(routing_decision.to_dict())
+        # Only the new decision; the state reducer appends it
+        executor_decisions = [routing_decision.to_dict()]
 
         # Finish execution event
         exec_event.finish()
-        execution_timeline = state.get("execution_timeline", [])
-        execution_timeline.append(exec_event.to_dict())
+        # Only the new event; the state reducer appends it to the timeline
+        execution_timeline = [exec_event.to_dict()]
 
         # HANDLE TASK COMPLETION
         if goto_worker == "task_complete" or is_complete:
-            # Mark task as complete
-            task_completion_status[task_id] = True
-
             completion_message = HumanMessage(
                 content=f"✓ Task '{current_task['content']}' completed after {len(processing_history)} worker(s). "
                         f"Reason: {reason}. Moving to next task...",
@@ -300,8 +299,7 @@ def handle_task_loop(state: State, executor_invocations: int) -> Command:
                     "messages": [completion_message],
                     "current_task_index": current_task_index + 1,
                     "current_task_id": None,
-                    "task_completion_status": task_completion_status,
-                    "task_processing_history": task_processing_history,
+                    "task_completion_status": {task_id: True},  # Mark task as complete
                     "executor_decisions": executor_decisions,
                     "execution_timeline": execution_timeline,
                 },
@@ -335,24 +333,19 @@ def handle_task_loop(state: State, executor_invocations: int) -> Command:
                         f"(max: {MAX_VISITS_PER_PROCESSOR}). Forcing completion to prevent infinite loop.",
                 name="executor"
             )
-            task_completion_status[task_id] = True
-            
+
             return Command(
                 update=_add_executor_counter({
                     "messages": [force_completion_message],
                     "current_task_index": current_task_index + 1,
                     "current_task_id": None,
-                    "task_completion_status": task_completion_status,
-                    "task_processing_history": task_processing_history,
+                    "task_completion_status": {task_id: True},
                     "executor_decisions": executor_decisions,
                     "execution_timeline": execution_timeline,
                 }, executor_invocations),
                 goto="executor"
             )
 
-        # Add worker to processing history
-        processing_history.append(goto_worker)
-
         routing_message = HumanMessage(
             content=f"→ Routing task '{current_task['content']}' (type: {task_classification}) to {goto_worker}. "
                     f"Reason: {reason}",
@@ -363,7 +356,8 @@ def handle_task_loop(state: State, executor_invocations: int) -> Command:
             update=_add_executor_counter({
                 "messages": [routing_message],
                 "current_task_id": task_id,
-                "task_processing_history": task_processing_history,
+                # Add worker to processing history (only this task's entry)
+                "task_processing_history": {task_id: processing_history + [goto_worker]},
                 "agent_query": f"Process task: {current_task['content']}",
                 "executor_decisions": executor_decisions,
                 "execution_timeline": execution_timeline,
@@ -378,10 +372,7 @@ def handle_task_loop(state: State, executor_invocations: int) -> Command:
             name="executor"
         )
 
-        # Initialize history if needed
-        if task_id not in task_processing_history:
-            task_processing_history[task_id] = []
-        processing_history = task_processing_history[task_id]
+        processing_history = task_processing_history.get(task_id, [])
 
         # SAFEGUARD: If we've already processed this task too many times, force completion
         if len(processing_history) >= MAX_PROCESSING_ATTEMPTS_PER_TASK:
@@ -390,15 +381,13 @@ def handle_task_loop(state: State, executor_invocations: int) -> Command:
                         f"Forcing completion to prevent infinite loop.",
                 name="executor"
             )
-            task_completion_status[task_id] = True
-            
+
             return Command(
                 update=_add_executor_counter({
                     "messages": [error_message, force_completion_message],
                     "current_task_index": current_task_index + 1,
                     "current_task_id": None,
-                    "task_completion_status": task_completion_status,
-                    "task_processing_history": task_processing_history,
+                    "task_completion_status": {task_id: True},
                 }, executor_invocations),
                 goto="executor"
             )
@@ -413,14 +402,12 @@ def handle_task_loop(state: State, executor_invocations: int) -> Command:
         else:
             fallback_worker = "next_action_processor"
 
-        # Track this fallback attempt
-        processing_history.append(fallback_worker)
-
         return Command(
             update=_add_executor_counter({
                 "messages": [error_message],
                 "current_task_id": task_id,
-                "task_processing_history": task_processing_history,
+                # Track this fallback attempt (only this task's entry)
+                "task_processing_history": {task_id: processing_history + [fallback_worker]},
             }, executor_invocations),
             goto=fallback_worker
         )
@@ -461,7 +448,7 @@ def handle_linear_plan(state: State, planned_agent: str, executor_invocations: i
         return Command(
             update=_add_executor_counter({
                 "messages": [routing_message],
-                "agent_query": f"Execute step {current_step}: {plan.get(str(current_step), {}).get('action', '')}",
+                "agent_query": f"Execute step {current_step}: {plan.get(current_step, {}).get('action', '')}",
             }, executor_invocations),
             goto=planned_agent
         )
@@ -474,8 +461,6 @@ def handle_linear_plan(state: State, planned_agent: str, executor_invocations: i
             current_step=current_step
         )
 
-        from config.model_factory import get_tracked_chat_model
-
         # Get last 4 messages for context
         recent_messages = messages[-4:] if len(messages) >= 4 else messages
         last_messages_text = "\n".join([
@@ -483,7 +468,7 @@ def handle_linear_plan(state: State, planned_agent: str, executor_invocations: i
         ])
 
         # Get agent guidelines
-        agent_guidelines = format_agent_guidelines_for_executor(enabled_agents)
+        agent_guidelines = get_workflow_context(tuple(enabled_agents)).executor_guidelines
 
         # Generate executor prompt
         prompt = get_executor_prompt(
@@ -504,14 +489,7 @@ def handle_linear_plan(state: State, planned_agent: str, executor_invocations: i
         response_text = response.content if hasattr(response, 'content') else str(response)
 
         # Parse JSON response
-        json_start = response_text.find("{")
-        json_end = response_text.rfind("}") + 1
-
-        if json_start >= 0 and json_end > json_start:
-            json_str = response_text[json_start:json_end]
-            decision = json.loads(json_str)
-        else:
-            raise ValueError("No valid JSON found in executor response")
+        decision = extract_json_object(response_text, source="executor")
 
         # Extract decision fields
         should_replan = decision.get("replan", False)
@@ -529,13 +507,13 @@ def handle_linear_plan(state: State, planned_agent: str, executor_invocations: i
             is_task_complete=False
         )
 
-        executor_decisions = state.get("executor_decisions", [])
-        executor_decisions.append(routing_decision.to_dict())
+        # Only the new decision; the state reducer appends it
+        executor_decisions = [routing_decision.to_dict()]
 
         # Finish execution event
         exec_event.finish()
-        execution_timeline = state.get("execution_timeline", [])
-        execution_timeline.append(exec_event.to_dict())
+        # Only the new event; the state reducer appends it to the timeline
+        execution_timeline = [exec_event.to_dict()]
 
         # Validate worker name - map common mistakes
         worker_name_mapping = {
@@ -14,6 +14,7 @@ from workers.next_action_processor import next_action_processor_node
 from workers.learning_processor import learning_processor_node
 from workers.planning_processor import planning_processor_node
 from workers.markdown_writer import markdown_writer_node
+from workers.batch_processor import batch_processor_node
 
 
 def build_graph():
@@ -34,6 +35,7 @@ def build_graph():
     workflow.add_node("research_processor", research_processor_node)
     workflow.add_node("next_action_processor", next_action_processor_node)
     workflow.add_node("learning_processor", learning_processor_node)
+    workflow.add_node("batch_processor", batch_processor_node)
     workflow.add_node("planning_processor", planning_processor_node)
     workflow.add_node("markdown_writer", markdown_writer_node)
 
@@ -0,0 +1,38 @@
+"""
+JSON Parsing Helpers
+Extracts JSON objects from LLM responses, using orjson when it is installed.
+"""
+from typing import Any, Dict
+
+try:
+    # orjson.loads takes str as well as bytes, so responses are passed as-is
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+
+def extract_json_object(response_text: str, source: str = "") -> Dict[str, Any]:
+    """
+    Parse the outermost JSON object in an LLM response.
+
+    Tolerates extra text around the object (e.g. explanations or code fences).
+
+    Args:
+        response_text: Raw text returned by the model
+        source: Optional name of the caller, used in the error message
+
+    Returns:
+        Parsed JSON object
+
+    Raises:
+        ValueError: If no JSON object is found or it cannot be parsed
+    """
+    json_start = response_text.find("{")
+    json_end = response_text.rfind("}") + 1
+
+    if json_start < 0 or json_end <= json_start:
+        prefix = f"{source} " if source else ""
+        raise ValueError(f"No valid JSON found in {prefix}response")
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError (a ValueError)
+    return _loads(response_text[json_start:json_end])
@@ -62,7 +62,7 @@ def format_comments_section(comments: List[Dict]) -> str:
     if not comments or len(comments) == 0:
         return "## Comments from Todoist\n\nNo comments yet.\n\n"
 
-    section = "## Comments from Todoist\n\n"
+    entries = []
 
     for i, comment in enumerate(comments, 1):
         # Format timestamp
@@ -76,9 +76,9 @@ def format_comments_section(comments: List[Dict]) -> str:
 
         content = comment.get('content', '').strip()
 
-        section += f"### Comment {i} ({posted_at_formatted})\n{content}\n\n"
+        entries.append(f"### Comment {i} ({posted_at_formatted})\n{content}\n\n")
 
-    return section
+    return "## Comments from Todoist\n\n" + "".join(entries)
 
 
 def get_learning_task_filepath(task: Dict) -> str:
@@ -26,6 +26,12 @@ class ExecutionEvent:
         if self.start_time:
             self.duration_seconds = (self.end_time - self.start_time).total_seconds()
 
+    def record_chunk(self):
+        """Record a streamed LLM chunk (time to first chunk and chunk count go in metadata)."""
+        if "time_to_first_chunk_seconds" not in self.metadata:
+            self.metadata["time_to_first_chunk_seconds"] = (datetime.now() - self.start_time).total_seconds()
+        self.metadata["stream_chunks"] = self.metadata.get("stream_chunks", 0) + 1
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -2,16 +2,57 @@
 Planner Node
 Creates execution plan for task processing workflow.
 """
-import json
+import re
 from typing import Literal
 from langchain_core.messages import HumanMessage
 from langgraph.types import Command
 
+from config.model_factory import get_chat_model
+from helpers.json_parsing import extract_json_object
 from helpers.state import State
-from prompts.agent_descriptions import format_agent_guidelines_for_planning
+from prompts.agent_descriptions import get_workflow_context
 from prompts.templates import get_planner_prompt
 
 
+# The plan the planner LLM produces for the standard request; used directly
+# so a standard run doesn't spend an LLM round trip on planning
+CANONICAL_PLAN = {
+    1: {"agent": "todoist_fetcher", "action": "Fetch today's tasks from Todoist"},
+    2: {"agent": "task_classifier", "action": "Classify all tasks into types"},
+    3: {"agent": "task_loop", "action": "Process each task individually with intelligent routing"},
+    4: {"agent": "markdown_writer", "action": "Generate final markdown report"},
+}
+
+# Agents the canonical plan routes to directly (task_loop is executor-internal)
+_CANONICAL_PLAN_AGENTS = frozenset({"todoist_fetcher", "task_classifier", "markdown_writer"})
+
+# Normalized phrasings of the standard request
+_STANDARD_QUERIES = frozenset({
+    "",
+    "process tasks",
+    "process my tasks",
+    "process todays tasks",
+    "process my todays tasks",
+    "process todays todoist tasks",
+    "process my todoist tasks",
+    "process my todays todoist tasks",
+})
+
+
+def is_standard_query(user_query: str) -> bool:
+    """
+    Check whether a user query asks for the standard fetch/classify/process/report run.
+
+    Args:
+        user_query: The user's request
+
+    Returns:
+        True if the canonical plan can be used without asking the planner LLM
+    """
+    normalized = " ".join(re.sub(r"[^a-z\s]", "", user_query.lower()).split())
+    return normalized in _STANDARD_QUERIES
+
+
 def planner_node(state: State) -> Command[Literal["executor"]]:
     """
     Create execution plan for processing tasks.
@@ -31,12 +72,27 @@ def planner_node(state: State) -> Command[Literal["executor"]]:
         "markdown_writer"
     ]
 
-    try:
-        # Import model factory
-        from config.model_factory import get_chat_model
+    # Standard request on first planning: skip the LLM and use the canonical plan
+    # (replans still go to the LLM, since the canonical plan is what failed)
+    if (
+        not state.get("plan")
+        and is_standard_query(user_query)
+        and _CANONICAL_PLAN_AGENTS.issubset(enabled_agents)
+    ):
+        return Command(
+            update={
+                "messages": [HumanMessage(content=_format_plan_summary(CANONICAL_PLAN), name="planner")],
+                # A copy, so the constant never becomes part of (mutable) run state
+                "plan": {step: dict(details) for step, details in CANONICAL_PLAN.items()},
+                "current_step": 1,
+                "replan_attempts": {},
+            },
+            goto="executor"
+        )
 
+    try:
         # Get agent guidelines
-        agent_guidelines = format_agent_guidelines_for_planning(enabled_agents)
+        agent_guidelines = get_workflow_context(tuple(enabled_agents)).planner_guidelines
 
         # Generate planner prompt
         prompt = get_planner_prompt(enabled_agents, agent_guidelines, user_query)
@@ -46,23 +102,15 @@ def planner_node(state: State) -> Command[Literal["executor"]]:
         response = model.invoke(prompt)
         response_text = response.content if hasattr(response, 'content') else str(response)
 
-        # Parse JSON response
-        json_start = response_text.find("{")
-        json_end = response_text.rfind("}") + 1
-
-        if json_start >= 0 and json_end > json_start:
-            json_str = response_text[json_start:json_end]
-            plan = json.loads(json_str)
-        else:
-            raise ValueError("No valid JSON found in planner response")
+        # Parse JSON response (step keys become ints once, here)
+        plan = {
+            int(step): details
+            for step, details in extract_json_object(response_text, source="planner").items()
+        }
 
         # Create plan summary message
-        plan_summary = "Created execution plan:\n"
-        for step, details in plan.items():
-            plan_summary += f"Step {step}: {details['agent']} - {details['action']}\n"
-
         plan_message = HumanMessage(
-            content=plan_summary,
+            content=_format_plan_summary(plan),
             name="planner"
         )
 
@@ -84,9 +132,9 @@ def planner_node(state: State) -> Command[Literal["executor"]]:
 
         # Create a simple fallback plan
         fallback_plan = {
-            "1": {"agent": "todoist_fetcher", "action": "Fetch today's tasks"},
-            "2": {"agent": "task_classifier", "action": "Classify each task"},
-            "3": {"agent": "markdown_writer", "action": "Generate report"}
+            1: {"agent": "todoist_fetcher", "action": "Fetch today's tasks"},
+            2: {"agent": "task_classifier", "action": "Classify each task"},
+            3: {"agent": "markdown_writer", "action": "Generate report"}
         }
 
         return Command(
@@ -98,3 +146,11 @@ def planner_node(state: State) -> Command[Literal["executor"]]:
             },
             goto="executor"
         )
+
+
+def _format_plan_summary(plan: dict) -> str:
+    """Build the planner's 'Created execution plan' message text."""
+    return "Created execution plan:\n" + "".join(
+        f"Step {step}: {details['agent']} - {details['action']}\n"
+        for step, details in plan.items()
+    )
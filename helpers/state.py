@@ -1,11 +1,30 @@
 """
 State management for the task processing workflow.
 """
+import operator
 from typing import Optional, List, Dict, Any
-from typing_extensions import TypedDict
+from typing_extensions import Annotated, TypedDict
 from langgraph.graph import MessagesState
 
 
+class TodayTask(TypedDict):
+    """
+    A task due today or overdue, as built by todoist_fetcher.
+
+    Kept as a plain dict (rather than an object) so graph state stays
+    serializable for checkpoints and the UI's state view.
+    """
+    id: str
+    content: str
+    description: str  # "" when the task has none
+    labels: List[str]
+    priority: int
+    due_date: str  # YYYY-MM-DD
+    project_id: str
+    created_at: str
+    comments: List[Dict[str, Any]]  # From helpers.todoist_helpers.get_task_comments
+
+
 class State(MessagesState):
     """
     State that flows through the LangGraph workflow.
@@ -13,19 +32,22 @@ class State(MessagesState):
     Inherits 'messages' from MessagesState for shared message history.
     """
     # Todoist data
-    todoist_tasks: Optional[List[Dict[str, Any]]]  # Tasks fetched from API
+    todoist_tasks: Optional[List[TodayTask]]  # Tasks fetched from API
+    tasks_by_id: Optional[Dict[str, TodayTask]]  # task_id -> task (same dicts as todoist_tasks)
     project_id_to_name: Optional[Dict[str, str]]  # project_id -> project_name mapping
     current_task_index: Optional[int]  # Which task is currently being processed
     current_task_id: Optional[str]  # ID of task currently being worked on
 
     # Task processing
     task_classifications: Optional[Dict[str, str]]  # task_id -> type mapping
-    processed_results: Optional[Dict[str, str]]  # task_id -> processing output
-    task_processing_history: Optional[Dict[str, List[str]]]  # task_id -> [worker names that processed it]
-    task_completion_status: Optional[Dict[str, bool]]  # task_id -> is_complete flag
+    processed_results: Annotated[Dict[str, str], operator.or_]  # task_id -> processing output (updates merged)
+    report_path: Optional[str]  # Markdown report written by markdown_writer
+    task_processing_history: Annotated[Dict[str, List[str]], operator.or_]  # task_id -> [worker names that processed it] (updates merged)
+    task_completion_status: Annotated[Dict[str, bool], operator.or_]  # task_id -> is_complete flag (updates merged)
+    batch_processing_done: Optional[bool]  # Pending tasks were already sent through batch_processor
 
     # Planning and execution
-    plan: Optional[Dict[str, Dict[str, Any]]]  # Execution plan from planner
+    plan: Optional[Dict[int, Dict[str, Any]]]  # Execution plan from planner (keyed by step number)
     current_step: Optional[int]  # Current step in the plan
     agent_query: Optional[str]  # Instruction for current worker
 
@@ -40,10 +62,10 @@ class State(MessagesState):
     task_limit: Optional[int]  # Maximum number of tasks to process
 
     # Observability and tracking
-    execution_timeline: Optional[List[Dict[str, Any]]]  # Node execution history with timing
+    execution_timeline: Annotated[List[Dict[str, Any]], operator.add]  # Node execution history with timing (updates appended)
     llm_call_log: Optional[List[Dict[str, Any]]]  # All LLM calls made during execution
-    executor_decisions: Optional[List[Dict[str, Any]]]  # Routing decisions with reasoning
+    executor_decisions: Annotated[List[Dict[str, Any]], operator.add]  # Routing decisions with reasoning (updates appended)
 
     # Context file tracking
-    task_context_files: Optional[Dict[str, str]]  # task_id -> context_file_path mapping
-    learning_task_files: Optional[Dict[str, str]]  # task_id -> learning_task_file_path mapping
+    task_context_files: Annotated[Dict[str, str], operator.or_]  # task_id -> context_file_path mapping (updates merged)
+    learning_task_files: Annotated[Dict[str, str], operator.or_]  # task_id -> learning_task_file_path mapping (updates merged)
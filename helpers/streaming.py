@@ -0,0 +1,48 @@
+"""
+Streaming helpers for worker LLM calls.
+Forwards response chunks to LangGraph's custom stream as they arrive.
+"""
+from typing import Optional
+from langgraph.config import get_stream_writer
+
+from helpers.observability import ExecutionEvent
+
+
+def stream_llm_text(
+    model,
+    prompt,
+    node_name: str,
+    task_id: Optional[str] = None,
+    exec_event: Optional[ExecutionEvent] = None
+) -> str:
+    """
+    Stream a model response, forwarding each chunk to graph.stream(stream_mode="custom").
+
+    Args:
+        model: Chat model (or TrackedChatModel) to stream from
+        prompt: Prompt string or list of messages
+        node_name: Name of the calling node, included with each chunk
+        task_id: Optional ID of the task being processed
+        exec_event: Optional execution event recording chunk timing
+
+    Returns:
+        The full response text
+    """
+    try:
+        writer = get_stream_writer()
+    except RuntimeError:
+        # Called outside a graph run (e.g. a node invoked directly); nothing to stream to
+        writer = lambda _: None
+    parts = []
+
+    for chunk in model.stream(prompt):
+        text = chunk.content if hasattr(chunk, 'content') else str(chunk)
+        if not text:
+            continue
+
+        parts.append(text)
+        if exec_event:
+            exec_event.record_chunk()
+        writer({"node": node_name, "task_id": task_id, "chunk": text})
+
+    return "".join(parts)
@@ -2,12 +2,78 @@
 Todoist Helper Functions
 Utility functions for working with Todoist API.
 """
-from typing import List, Dict, Any, Optional
+import random
+import time
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, Optional, TypeVar
+import requests
+from requests.adapters import HTTPAdapter
 from todoist_api_python.api import TodoistAPI
 
 from config.config import TODOIST_API_TOKEN
 
 
+# Connections kept alive to the Todoist API (comments are fetched concurrently)
+TODOIST_POOL_SIZE = 16
+
+# Retry settings for transient Todoist errors (rate limiting, 5xx, network)
+RETRY_ATTEMPTS = 4
+RETRY_BASE_DELAY_SECONDS = 0.25
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=1)
+def get_todoist_api() -> TodoistAPI:
+    """
+    Return the shared Todoist API client.
+
+    The client's requests session is reused by every call, so HTTPS
+    connections stay alive instead of being set up again per request.
+
+    Returns:
+        TodoistAPI instance backed by a pooled session
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=TODOIST_POOL_SIZE))
+    return TodoistAPI(TODOIST_API_TOKEN, session=session)
+
+
+def call_with_retry(call: Callable[[], T], attempts: int = RETRY_ATTEMPTS, base_delay: float = RETRY_BASE_DELAY_SECONDS) -> T:
+    """
+    Call a Todoist API function, retrying transient failures with exponential backoff.
+
+    Retries on 429/5xx responses and on connection errors or timeouts,
+    honoring the Retry-After header when Todoist sends one. Any other error,
+    or the last failed attempt, is raised to the caller.
+
+    Args:
+        call: Zero-argument function making the API request
+        attempts: Maximum number of attempts
+        base_delay: Delay before the first retry, doubled on each further retry
+
+    Returns:
+        Whatever call returns
+    """
+    for attempt in range(attempts):
+        try:
+            return call()
+        except requests.HTTPError as e:
+            response = e.response
+            if response is None or response.status_code not in RETRYABLE_STATUS_CODES or attempt == attempts - 1:
+                raise
+            retry_after = response.headers.get("Retry-After", "")
+            delay = float(retry_after) if retry_after.isdigit() else base_delay * 2 ** attempt
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == attempts - 1:
+                raise
+            delay = base_delay * 2 ** attempt
+
+        # Jitter keeps concurrent callers from retrying in lockstep
+        time.sleep(delay + random.random() * 0.1)
+
+
 def get_task_comments(task_id: str) -> List[Dict[str, Any]]:
     """
     Fetch all comments for a specific task.
@@ -27,34 +93,31 @@ def get_task_comments(task_id: str) -> List[Dict[str, Any]]:
         }
 
     Raises:
-        Exception: If there's an error fetching comments from Todoist API
+        requests.HTTPError: If the Todoist API returns an error response
+        requests.RequestException: If the request fails (connection error, timeout)
 
     Example:
         >>> comments = get_task_comments("2995104339")
         >>> for comment in comments:
         ...     print(f"{comment['posted_at']}: {comment['content']}")
     """
-    try:
-        api = TodoistAPI(TODOIST_API_TOKEN)
-        comments = api.get_comments(task_id=task_id)
-
-        # Convert comment objects to dictionaries for easier handling
-        comment_list = []
-        for comment in comments:
-            comment_dict = {
-                "id": comment.id,
-                "task_id": comment.task_id,
-                "project_id": comment.project_id,
-                "posted_at": comment.posted_at,
-                "content": comment.content,
-                "attachment": comment.attachment if hasattr(comment, 'attachment') else None,
-            }
-            comment_list.append(comment_dict)
-
-        return comment_list
+    api = get_todoist_api()
+    comments = api.get_comments(task_id=task_id)
+
+    # Convert comment objects to dictionaries for easier handling
+    comment_list = []
+    for comment in comments:
+        comment_dict = {
+            "id": comment.id,
+            "task_id": comment.task_id,
+            "project_id": comment.project_id,
+            "posted_at": comment.posted_at,
+            "content": comment.content,
+            "attachment": comment.attachment if hasattr(comment, 'attachment') else None,
+        }
+        comment_list.append(comment_dict)
 
-    except Exception as e:
-        raise Exception(f"Error fetching comments for task {task_id}: {str(e)}")
+    return comment_list
 
 
 def format_comments_for_display(comments: List[Dict[str, Any]]) -> str:
@@ -113,7 +176,7 @@ def get_task_with_comments(task_id: str) -> Optional[Dict[str, Any]]:
         >>> print(f"Comments: {len(task_data['comments'])}")
     """
     try:
-        api = TodoistAPI(TODOIST_API_TOKEN)
+        api = get_todoist_api()
 
         # Get the task
         task = api.get_task(task_id=task_id)
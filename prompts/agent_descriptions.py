@@ -1,7 +1,10 @@
 """
 Agent metadata and descriptions for task processing workers.
 """
-from typing import Dict, Any, List
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple
 
 
 def get_agent_descriptions() -> Dict[str, Dict[str, Any]]:
@@ -127,3 +130,32 @@ def format_agent_guidelines_for_executor(enabled_agents: List[str]) -> str:
             guidelines.append(guideline)
 
     return "\n".join(guidelines)
+
+
+@dataclass(frozen=True)
+class WorkflowContext:
+    """Agent guideline strings shared by the planner and executor for one agent set."""
+
+    planner_guidelines: str
+    executor_guidelines: str
+
+
+@lru_cache(maxsize=32)
+def get_workflow_context(enabled_agents: Tuple[str, ...]) -> WorkflowContext:
+    """
+    Build (once per agent set) the guideline strings used by planner and executor prompts.
+
+    The strings are interned so every prompt built for the same agent set
+    references the same objects instead of re-formatting fresh copies.
+
+    Args:
+        enabled_agents: Tuple of enabled worker names
+
+    Returns:
+        WorkflowContext with planner and executor guidelines
+    """
+    agents = list(enabled_agents)
+    return WorkflowContext(
+        planner_guidelines=sys.intern(format_agent_guidelines_for_planning(agents)),
+        executor_guidelines=sys.intern(format_agent_guidelines_for_executor(agents)),
+    )
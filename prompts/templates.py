@@ -1,21 +1,66 @@
 """
 Prompt templates for planner and executor nodes.
 """
+from dataclasses import dataclass
+from functools import lru_cache
+from string import Formatter
+from typing import Dict, Final, Iterator, Optional, Tuple, Union
 
 
-def get_planner_prompt(enabled_agents: list, agent_guidelines: str, user_query: str) -> str:
+# Static prompt blocks, shared across calls rather than rebuilt per prompt
+_VALID_PLANNER_AGENTS_BLOCK: Final[str] = """- todoist_fetcher
+- task_classifier
+- research_processor
+- next_action_processor
+- markdown_writer"""
+
+# The executor may route to every planner agent, plus replanning and END
+_VALID_EXECUTOR_AGENTS_BLOCK: Final[str] = _VALID_PLANNER_AGENTS_BLOCK + """
+- planner (for replanning)
+- END (when workflow is complete)"""
+
+_VALID_TASK_LOOP_WORKERS_BLOCK: Final[str] = """- research_processor (for research tasks)
+- learning_processor (for learning and abstract tasks)
+- planning_processor (for planning tasks - analyzes progress and identifies remaining steps)
+- next_action_processor (for short tasks)
+- task_complete (signals this task is fully processed, move to next task)"""
+
+_TASK_TYPES_BLOCK: Final[str] = """- research: Tasks requiring web search, reading notes, or gathering information
+- planning: Tasks requiring structured planning methodology or breaking down a project
+- short: Simple tasks that need a clear next action step
+- learning: Educational tasks for building knowledge or skills
+- abstract: Tasks involving model building, asking questions, finding parallels, or conceptual thinking"""
+
+
+@dataclass(frozen=True, slots=True)
+class _TaskView:
+    """Prompt-ready text fields of a task, normalized once per task."""
+
+    content: str
+    description: str
+    labels: str
+
+
+def _view(task: Union[dict, _TaskView]) -> _TaskView:
     """
-    Creates the planner prompt that generates the execution plan.
+    Normalize a task's content, description and labels for prompt rendering.
 
     Args:
-        enabled_agents: List of available worker names
-        agent_guidelines: Detailed guidelines for each agent
-        user_query: User's request
+        task: Task dictionary, or an already-normalized view (returned as-is)
 
     Returns:
-        Formatted planner prompt
+        _TaskView with description defaulted to 'None' and labels joined
     """
-    return f"""You are a task processing planner. Your job is to create a task-loop execution plan for processing Todoist tasks.
+    if isinstance(task, _TaskView):
+        return task
+    return _TaskView(
+        content=task['content'],
+        description=task.get('description', 'None'),
+        labels=', '.join(labels) if (labels := task.get('labels')) else '',
+    )
+
+
+_PLANNER_TEMPLATE = """You are a task processing planner. Your job is to create a task-loop execution plan for processing Todoist tasks.
 
 USER REQUEST:
 {user_query}
@@ -24,11 +69,7 @@ AVAILABLE AGENTS:
 {agent_guidelines}
 
 VALID AGENT NAMES (use EXACTLY these names in your plan):
-- todoist_fetcher
-- task_classifier
-- research_processor
-- next_action_processor
-- markdown_writer
+""" + _VALID_PLANNER_AGENTS_BLOCK + """
 
 PLANNING INSTRUCTIONS:
 1. The workflow has two phases:
@@ -63,47 +104,41 @@ Return ONLY the JSON object, no other text.
 """
 
 
-def get_executor_prompt(
-    plan: dict,
-    current_step: int,
-    agent_guidelines: str,
-    last_messages: str,
-    last_reason: str = None
-) -> str:
+def get_planner_prompt(enabled_agents: list, agent_guidelines: str, user_query: str) -> str:
     """
-    Creates the executor prompt for routing decisions.
+    Creates the planner prompt that generates the execution plan.
 
     Args:
-        plan: The execution plan from planner
-        current_step: Current step number
-        agent_guidelines: Agent capability descriptions
-        last_messages: Recent message history
-        last_reason: Previous executor decision reason
+        enabled_agents: List of available worker names
+        agent_guidelines: Detailed guidelines for each agent
+        user_query: User's request
 
     Returns:
-        Formatted executor prompt
+        Formatted planner prompt
     """
-    current_step_info = plan.get(str(current_step), {})
+    return _build_planner_prompt(agent_guidelines, user_query)
 
-    context = f"\nPrevious decision reason: {last_reason}" if last_reason else ""
 
-    return f"""You are the executor. Your job is to decide which agent to invoke next based on the current plan step.
+@lru_cache(maxsize=32)
+def _build_planner_prompt(agent_guidelines: str, user_query: str) -> str:
+    """Render the planner prompt; guidelines are fixed per agent set, so repeat runs reuse it."""
+    return _PLANNER_TEMPLATE.format_map({
+        "user_query": user_query,
+        "agent_guidelines": agent_guidelines,
+    })
+
+
+_EXECUTOR_TEMPLATE = """You are the executor. Your job is to decide which agent to invoke next based on the current plan step.
 
 CURRENT PLAN STEP: {current_step}
-Planned agent: {current_step_info.get('agent', 'unknown')}
-Planned action: {current_step_info.get('action', 'unknown')}
+Planned agent: {planned_agent}
+Planned action: {planned_action}
 
 AVAILABLE AGENTS:
 {agent_guidelines}
 
 VALID AGENT NAMES (use EXACTLY these names):
-- todoist_fetcher
-- task_classifier
-- research_processor
-- next_action_processor
-- markdown_writer
-- planner (for replanning)
-- END (when workflow is complete)
+""" + _VALID_EXECUTOR_AGENTS_BLOCK + """
 
 RECENT MESSAGES:
 {last_messages}
@@ -138,54 +173,83 @@ Return ONLY the JSON object, no other text.
 """
 
 
-def get_task_loop_executor_prompt(
-    current_task: dict,
-    task_classification: str,
-    processing_history: list,
-    last_worker_output: str,
+def get_executor_prompt(
+    plan: dict,
+    current_step: int,
     agent_guidelines: str,
-    tasks_remaining: int
+    last_messages: str,
+    last_reason: str = None
 ) -> str:
     """
-    Creates the executor prompt for task-loop routing decisions.
+    Creates the executor prompt for routing decisions.
 
     Args:
-        current_task: The task being processed
-        task_classification: The type classification for this task
-        processing_history: List of workers that have already processed this task
-        last_worker_output: Output from the last worker
+        plan: The execution plan from planner, keyed by int step number
+        current_step: Current step number
         agent_guidelines: Agent capability descriptions
-        tasks_remaining: Number of tasks left to process
+        last_messages: Recent message history
+        last_reason: Previous executor decision reason
 
     Returns:
-        Formatted task-loop executor prompt
+        Formatted executor prompt
     """
-    history_text = ", ".join(processing_history) if processing_history else "None yet"
+    step_info = plan.get(current_step, {})
+    planned_agent, planned_action = step_info.get('agent', 'unknown'), step_info.get('action', 'unknown')
+
+    # Only the current step's agent/action reach the prompt, so they stand in
+    # for the (unhashable) plan dict in the cache key
+    return _build_executor_prompt(
+        current_step,
+        planned_agent,
+        planned_action,
+        agent_guidelines,
+        last_messages,
+        last_reason
+    )
+
+
+@lru_cache(maxsize=256)
+def _build_executor_prompt(
+    current_step: int,
+    planned_agent: str,
+    planned_action: str,
+    agent_guidelines: str,
+    last_messages: str,
+    last_reason: str = None
+) -> str:
+    """Render the executor prompt; memoized so replays of the same step reuse it."""
+    context = f"\nPrevious decision reason: {last_reason}" if last_reason else ""
 
-    return f"""You are the task-loop executor. Your job is to intelligently route individual tasks to appropriate workers and determine when tasks are complete.
+    return _EXECUTOR_TEMPLATE.format_map({
+        "current_step": current_step,
+        "planned_agent": planned_agent,
+        "planned_action": planned_action,
+        "agent_guidelines": agent_guidelines,
+        "last_messages": last_messages,
+        "context": context,
+    })
+
+
+_TASK_LOOP_EXECUTOR_TEMPLATE = """You are the task-loop executor. Your job is to intelligently route individual tasks to appropriate workers and determine when tasks are complete.
 
 CURRENT TASK:
-ID: {current_task['id']}
-Content: {current_task['content']}
-Description: {current_task.get('description', 'None')}
+ID: {task_id}
+Content: {content}
+Description: {description}
 Classification: {task_classification}
-Priority: {current_task['priority']}
+Priority: {priority}
 
 PROCESSING HISTORY FOR THIS TASK:
 Workers that have processed it: {history_text}
 
 LAST WORKER OUTPUT:
-{last_worker_output if last_worker_output else "Task just entered the loop"}
+{last_worker_output}
 
 AVAILABLE WORKERS:
 {agent_guidelines}
 
 VALID WORKER NAMES:
-- research_processor (for research tasks)
-- learning_processor (for learning and abstract tasks)
-- planning_processor (for planning tasks - analyzes progress and identifies remaining steps)
-- next_action_processor (for short tasks)
-- task_complete (signals this task is fully processed, move to next task)
+""" + _VALID_TASK_LOOP_WORKERS_BLOCK + """
 
 TASKS REMAINING: {tasks_remaining} (including current)
 
@@ -230,86 +294,133 @@ Return ONLY the JSON object, no other text.
 """
 
 
-def get_task_classifier_prompt(tasks: list) -> str:
+# (literal, field) pairs of the task-loop template, split once for chunked rendering
+_TASK_LOOP_EXECUTOR_PARTS = [
+    (literal, field) for literal, field, _, _ in Formatter().parse(_TASK_LOOP_EXECUTOR_TEMPLATE)
+]
+
+
+def iter_task_loop_executor_prompt(
+    current_task: dict,
+    task_classification: str,
+    processing_history: list,
+    last_worker_output: str,
+    agent_guidelines: str,
+    tasks_remaining: int
+) -> Iterator[str]:
     """
-    Creates prompt for classifying task types.
+    Yields the task-loop executor prompt as a sequence of string chunks.
+
+    Lets callers that stream a request body forward the prompt without
+    materializing it as one large string (last_worker_output can be multi-KB).
 
     Args:
-        tasks: List of task objects with content, description, labels
+        current_task: The task being processed
+        task_classification: The type classification for this task
+        processing_history: List of workers that have already processed this task
+        last_worker_output: Output from the last worker
+        agent_guidelines: Agent capability descriptions
+        tasks_remaining: Number of tasks left to process
+
+    Yields:
+        Static template text and substituted values, in prompt order
+    """
+    history_text = ", ".join(processing_history) if processing_history else "None yet"
+    view = _view(current_task)
+
+    values = {
+        "task_id": current_task['id'],
+        "content": view.content,
+        "description": view.description,
+        "task_classification": task_classification,
+        "priority": current_task['priority'],
+        "history_text": history_text,
+        "last_worker_output": last_worker_output if last_worker_output else "Task just entered the loop",
+        "agent_guidelines": agent_guidelines,
+        "tasks_remaining": tasks_remaining,
+    }
+
+    for literal, field in _TASK_LOOP_EXECUTOR_PARTS:
+        if literal:
+            yield literal
+        if field is not None:
+            yield str(values[field])
+
+
+def get_task_loop_executor_prompt(
+    current_task: dict,
+    task_classification: str,
+    processing_history: list,
+    last_worker_output: str,
+    agent_guidelines: str,
+    tasks_remaining: int
+) -> str:
+    """
+    Creates the executor prompt for task-loop routing decisions.
+
+    Args:
+        current_task: The task being processed
+        task_classification: The type classification for this task
+        processing_history: List of workers that have already processed this task
+        last_worker_output: Output from the last worker
+        agent_guidelines: Agent capability descriptions
+        tasks_remaining: Number of tasks left to process
 
     Returns:
-        Formatted classification prompt
+        Formatted task-loop executor prompt
     """
-    task_info = []
-    for i, task in enumerate(tasks):
-        task_info.append(
-            f"Task {i+1} (ID: {task['id']}):\n"
-            f"  Content: {task['content']}\n"
-            f"  Description: {task.get('description', 'None')}\n"
-            f"  Labels: {', '.join(task.get('labels', []))}\n"
-        )
+    return "".join(iter_task_loop_executor_prompt(
+        current_task=current_task,
+        task_classification=task_classification,
+        processing_history=processing_history,
+        last_worker_output=last_worker_output,
+        agent_guidelines=agent_guidelines,
+        tasks_remaining=tasks_remaining
+    ))
 
-    tasks_text = "\n".join(task_info)
 
-    return f"""You are a task classifier. Analyze each task and classify it into one of these types:
+_TASK_CLASSIFIER_TEMPLATE = """You are a task classifier. Analyze each task and classify it into one of these types:
 
 TASK TYPES:
-- research: Tasks requiring web search, reading notes, or gathering information
-- planning: Tasks requiring structured planning methodology or breaking down a project
-- short: Simple tasks that need a clear next action step
-- learning: Educational tasks for building knowledge or skills
-- abstract: Tasks involving model building, asking questions, finding parallels, or conceptual thinking
+""" + _TASK_TYPES_BLOCK + """
 
 TASKS TO CLASSIFY:
 {tasks_text}
 
 OUTPUT FORMAT:
-Return a JSON object mapping task IDs to their types:
-{{
-  "task_id_1": "research",
-  "task_id_2": "short",
-  "task_id_3": "learning"
-}}
+Return one classification per task, each with:
+- task_id: the task's ID, exactly as given above
+- task_type: one of research, planning, short, learning, abstract
 
-Analyze each task carefully and assign the most appropriate type. Return ONLY the JSON object, no other text.
+Analyze each task carefully and assign the most appropriate type. Classify every task; skip none.
 """
 
 
-def get_processor_prompt(task_type: str, task: dict, context: str = None, comments: list = None, project_name: str = None) -> str:
+def get_task_classifier_prompt(tasks: list) -> str:
     """
-    Creates prompt for specialized task processors.
+    Creates prompt for classifying task types.
 
     Args:
-        task_type: Type of task (research/planning/short/learning/abstract)
-        task: Task object with content and metadata
-        context: Optional context information from context files
-        comments: Optional list of task comments
-        project_name: Optional project name
+        tasks: List of task objects with content, description, labels
 
     Returns:
-        Formatted processor prompt
+        Formatted classification prompt
     """
-    # Format comments section if provided
-    comments_section = ""
-    if comments and len(comments) > 0:
-        comments_section = "\nComments:\n"
-        for i, comment in enumerate(comments, 1):
-            posted_at = comment.get('posted_at', 'Unknown')
-            content = comment.get('content', '')
-            comments_section += f"  {i}. ({posted_at}): {content}\n"
+    tasks_text = "\n".join(
+        f"Task {i+1} (ID: {task['id']}):\n"
+        f"  Content: {view.content}\n"
+        f"  Description: {view.description}\n"
+        f"  Labels: {view.labels}\n"
+        for i, (task, view) in enumerate((t, _view(t)) for t in tasks)
+    )
 
-    # Format project info
-    project_info = f"Project: {project_name}\n" if project_name else ""
+    return _TASK_CLASSIFIER_TEMPLATE.format_map({"tasks_text": tasks_text})
 
-    # Build learning prompt with conditional sections
-    learning_prompt = f"""You are a learning curriculum builder. Create a comprehensive learning path for this educational task.
 
-TASK:
-{project_info}Content: {task['content']}
-Description: {task.get('description', 'None')}
-Labels: {', '.join(task.get('labels', []))}
-{comments_section}
-{context if context else ""}
+# Learning processor instructions carry no task data, so they can be sent as a
+# cacheable prefix; one variant per (has_context, has_comments, with_next_step) combination
+def _build_learning_instructions(has_context: bool, has_comments: bool, with_next_step: bool) -> str:
+    instructions = """You are a learning curriculum builder. Create a comprehensive learning path for this educational task.
 
 OUTPUT:
 Generate a detailed, well-structured learning plan in markdown format with these sections:
@@ -330,32 +441,152 @@ Suggested materials (documentation, tutorials, examples, courses).
 Hands-on exercises or projects to reinforce learning.
 """
 
-    if context:
-        learning_prompt += """
+    if has_context:
+        instructions += """
 ### 6. Connection to Previous Learning
 How this builds on past work or relates to your learning context.
 """
 
-    if comments_section:
-        learning_prompt += """
+    if has_comments:
+        instructions += """
 ### 7. Insights from Comments
 Key points, resources, or guidance from task comments.
 """
 
-    learning_prompt += """
+    if with_next_step:
+        return instructions + """
+Return your learning plan as well-structured markdown. Be comprehensive but concise.
+Do NOT include a "Next Steps" section in the learning plan - the next step is returned separately, as described below.
+""" + _LEARNING_NEXT_STEP_INSTRUCTIONS
+
+    return instructions + """
 Return your learning plan as well-structured markdown. Be comprehensive but concise.
 Do NOT include a "Next Steps" section - that will be generated separately.
 """
 
-    prompts = {
-        "research": f"""You are a research task processor. Analyze this research task and create a research plan.
 
-TASK:
-Content: {task['content']}
-Description: {task.get('description', 'None')}
-Labels: {', '.join(task.get('labels', []))}
+# Added when the learning plan and next step are requested in one call
+_LEARNING_NEXT_STEP_INSTRUCTIONS: Final[str] = """
+NEXT STEP:
+Also suggest the SINGLE MOST IMPORTANT next action the user should take RIGHT NOW to make progress on this learning task, based on your learning plan, the comments, and any context provided.
+
+The next step should be:
+- Specific and actionable (not vague like "learn more")
+- Achievable in one focused work session (1-2 hours max)
+- The logical first/next step in the learning path
+- Concrete (e.g., "Read Chapter 3 of X", "Watch video at URL", "Build example Y")
+
+Return the markdown learning plan as `learning_plan` and the next step, as 1-2 direct sentences, as `next_step`.
+"""
+
+_LEARNING_INSTRUCTIONS: Final[Dict[Tuple[bool, bool, bool], str]] = {
+    (has_context, has_comments, with_next_step): _build_learning_instructions(has_context, has_comments, with_next_step)
+    for has_context in (False, True)
+    for has_comments in (False, True)
+    for with_next_step in (False, True)
+}
+
+
+def _comments_key(comments: list) -> Tuple[Tuple[str, str], ...]:
+    """Reduce task comments to hashable (posted_at, content) pairs."""
+    if not comments:
+        return ()
+    return tuple(
+        (comment.get('posted_at', 'Unknown'), comment.get('content', ''))
+        for comment in comments
+    )
+
+
+def _format_comments_section(comments_key: Tuple[Tuple[str, str], ...]) -> str:
+    """Render task comments for processor prompts ('' when there are none)."""
+    if not comments_key:
+        return ""
+    return "\nComments:\n" + "".join(
+        f"  {i}. ({posted_at}): {content}\n"
+        for i, (posted_at, content) in enumerate(comments_key, 1)
+    )
+
+
+_LEARNING_TASK_TEMPLATE = """TASK:
+{project_info}Content: {content}
+Description: {description}
+Labels: {labels}
+{comments_section}
+{context}
+"""
+
+
+@lru_cache(maxsize=512)
+def _learning_task_text(
+    view: _TaskView,
+    context: Optional[str],
+    comments_key: Tuple[Tuple[str, str], ...],
+    project_name: Optional[str]
+) -> str:
+    """Render the learning processor's user message from hashable inputs; memoized per task."""
+    return _LEARNING_TASK_TEMPLATE.format_map({
+        "project_info": f"Project: {project_name}\n" if project_name else "",
+        "content": view.content,
+        "description": view.description,
+        "labels": view.labels,
+        "comments_section": _format_comments_section(comments_key),
+        "context": context if context else "",
+    })
+
+
+def _system_cache_block(text: str) -> dict:
+    """Wrap static prompt text as a content block marked for provider prompt caching."""
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
+
+def _system_message(instructions: str, cache_control: bool) -> dict:
+    """Build the static system message, optionally marked with Anthropic cache_control."""
+    return {"role": "system", "content": [_system_cache_block(instructions)] if cache_control else instructions}
+
+
+def get_learning_processor_messages(
+    task: Union[dict, _TaskView],
+    context: str = None,
+    comments: list = None,
+    project_name: str = None,
+    cache_control: bool = False,
+    with_next_step: bool = False
+) -> list:
+    """
+    Creates the learning processor prompt as system + user messages.
+
+    The static instructions go in the system message and the task data in the
+    user message, so providers can reuse the instruction prefix across tasks.
 
-{context if context else ""}
+    Args:
+        task: Task object with content and metadata, or a pre-normalized _TaskView
+        context: Optional context information from context files
+        comments: Optional list of task comments
+        project_name: Optional project name
+        cache_control: Mark the system prefix with Anthropic cache_control
+        with_next_step: Also ask for the next immediate step (for a single
+            structured-output call returning learning_plan and next_step)
+
+    Returns:
+        List of message dicts accepted by chat model invoke()
+    """
+    # A frozen view plus comment pairs make the inputs hashable, so retries and
+    # replans of an unchanged task reuse the rendered task text
+    comments_key = _comments_key(comments)
+
+    instructions = _LEARNING_INSTRUCTIONS[(bool(context), bool(comments_key), with_next_step)]
+
+    return [
+        _system_message(instructions, cache_control),
+        {"role": "user", "content": _learning_task_text(_view(task), context, comments_key, project_name)},
+    ]
+
+
+# Per-type processor instructions (learning is assembled from
+# _LEARNING_INSTRUCTIONS instead, since its sections vary); static, so they
+# can be sent as a cacheable system prefix
+_PROCESSOR_INSTRUCTIONS: Final[Dict[str, str]] = {
+    "research": """You are a research task processor. Analyze this research task and create a research plan.
 
 OUTPUT:
 Generate a research plan that includes:
@@ -366,28 +597,14 @@ Generate a research plan that includes:
 Return your analysis as a structured text response.
 """,
 
-        "short": f"""You are a next action processor. Suggest the immediate next actionable step for this task.
-
-TASK:
-Content: {task['content']}
-Description: {task.get('description', 'None')}
-Labels: {', '.join(task.get('labels', []))}
-
-{context if context else ""}
+    "short": """You are a next action processor. Suggest the immediate next actionable step for this task.
 
 OUTPUT:
 Return a single sentence describing the concrete next action to take.
 Make it specific, actionable, and achievable in one sitting.
 """,
 
-        "planning": f"""You are a planning methodology processor. Create a structured plan for this task.
-
-TASK:
-Content: {task['content']}
-Description: {task.get('description', 'None')}
-Labels: {', '.join(task.get('labels', []))}
-
-{context if context else ""}
+    "planning": """You are a planning methodology processor. Create a structured plan for this task.
 
 OUTPUT:
 Generate a structured plan with:
@@ -399,16 +616,7 @@ Generate a structured plan with:
 Return your plan as structured text.
 """,
 
-        "learning": learning_prompt,
-
-        "abstract": f"""You are an abstract model builder. Generate insights for this conceptual task.
-
-TASK:
-Content: {task['content']}
-Description: {task.get('description', 'None')}
-Labels: {', '.join(task.get('labels', []))}
-
-{context if context else ""}
+    "abstract": """You are an abstract model builder. Generate insights for this conceptual task.
 
 OUTPUT:
 Generate:
@@ -418,118 +626,65 @@ Generate:
 4. Different perspectives or stories
 
 Return your analysis as structured text.
-"""
-    }
-
-    return prompts.get(task_type, prompts["short"])
-
-
-def get_next_step_prompt(task: dict, learning_plan: str, comments: list = None, context: str = None) -> str:
-    """
-    Creates prompt for generating the next immediate actionable step.
-
-    Args:
-        task: Task object with content and metadata
-        learning_plan: The learning path generated by the learning processor
-        comments: Optional list of task comments
-        context: Optional context information from context files
-
-    Returns:
-        Formatted prompt for next step generation
-    """
-    # Format comments section
-    comments_section = ""
-    if comments and len(comments) > 0:
-        comments_section = "\nCOMMENTS:\n"
-        for i, comment in enumerate(comments, 1):
-            posted_at = comment.get('posted_at', 'Unknown')
-            content = comment.get('content', '')
-            comments_section += f"{i}. ({posted_at}): {content}\n"
-
-    prompt = f"""You are a learning action planner. Your task is to suggest ONE specific, actionable next step.
-
-TASK:
-{task['content']}
-
-LEARNING PLAN SUMMARY:
-{learning_plan}
-
-{comments_section if comments_section else ""}
-
-{context if context else ""}
-
-INSTRUCTIONS:
-Based on the learning plan, comments, and any context provided, suggest the SINGLE MOST IMPORTANT next action the user should take RIGHT NOW to make progress on this learning task.
-
-The next step should be:
-- Specific and actionable (not vague like "learn more")
-- Achievable in one focused work session (1-2 hours max)
-- The logical first/next step in the learning path
-- Concrete (e.g., "Read Chapter 3 of X", "Watch video at URL", "Build example Y")
-
-OUTPUT:
-Return ONLY the next step as 1-2 sentences. Be direct and specific.
-
-Example good outputs:
-- "Read the LangGraph 'Core Concepts' documentation at https://langchain-ai.github.io/langgraph/concepts/, focusing on the State and MessageGraph sections."
-- "Clone the example repository from the first comment and run the basic_agent.py script to see a working implementation."
-- "Watch the 15-minute LangChain YouTube tutorial on agents, then try modifying the example code to add a custom tool."
+""",
+}
 
-Example bad outputs:
-- "Learn about LangGraph" (too vague)
-- "Study for 5 hours" (not specific about what to study)
-- "Do research" (not actionable)
+# Task payload shared by the per-type processors
+_PROCESSOR_TASK_TEMPLATE: Final[str] = """TASK:
+Content: {content}
+Description: {description}
+Labels: {labels}
 
-Return ONLY the next step, nothing else.
+{context}
 """
 
-    return prompt
-
-
-def get_planning_processor_prompt(
-    goal: str,
-    steps_taken: list,
-    task_description: str = "",
-    project_name: str = "",
-    search_results: str = ""
-) -> str:
+def get_processor_messages(
+    task_type: str,
+    task: Union[dict, _TaskView],
+    context: str = None,
+    comments: list = None,
+    project_name: str = None,
+    cache_control: bool = False
+) -> list:
     """
-    Creates prompt for planning processor with progress analysis and web search.
+    Creates a specialized processor prompt as system + user messages.
+
+    The per-type instructions go in the system message and the task data in
+    the user message, so providers can reuse the instruction prefix across tasks.
 
     Args:
-        goal: The goal from task name
-        steps_taken: List of steps already completed (from comments)
-        task_description: Optional task description
+        task_type: Type of task (research/planning/short/learning/abstract)
+        task: Task object with content and metadata, or a pre-normalized _TaskView
+        context: Optional context information from context files
+        comments: Optional list of task comments
         project_name: Optional project name
-        search_results: Web search results for required steps
+        cache_control: Mark the system prefix with Anthropic cache_control
 
     Returns:
-        Formatted prompt for planning analysis
+        List of message dicts accepted by chat model invoke()
     """
-    # Format steps taken section
-    steps_taken_section = ""
-    if steps_taken:
-        steps_taken_section = "\n## Steps Taken So Far (from comments):\n"
-        for i, step in enumerate(steps_taken, 1):
-            steps_taken_section += f"{i}. {step}\n"
-    else:
-        steps_taken_section = "\n## Steps Taken So Far:\nNo steps documented yet in comments.\n"
+    if task_type == "learning":
+        return get_learning_processor_messages(task, context, comments, project_name, cache_control)
 
-    # Format project info
-    project_info = f"Project: {project_name}\n" if project_name else ""
-
-    prompt = f"""You are a planning progress analyzer. Your task is to analyze progress toward a goal and identify what remains to be done.
+    # Unknown types fall back to short
+    return [
+        _system_message(_PROCESSOR_INSTRUCTIONS.get(task_type, _PROCESSOR_INSTRUCTIONS["short"]), cache_control),
+        {"role": "user", "content": _processor_task_text(_view(task), context)},
+    ]
 
-GOAL (from task name):
-{goal}
 
-{project_info}
-Task Description: {task_description if task_description else "None"}
+@lru_cache(maxsize=512)
+def _processor_task_text(view: _TaskView, context: Optional[str]) -> str:
+    """Render a per-type processor's user message from hashable inputs; memoized per task."""
+    return _PROCESSOR_TASK_TEMPLATE.format_map({
+        "content": view.content,
+        "description": view.description,
+        "labels": view.labels,
+        "context": context if context else "",
+    })
 
-{steps_taken_section}
 
-## Web Search Results (for identifying required steps):
-{search_results if search_results else "No web search results available."}
+_PLANNING_PROCESSOR_INSTRUCTIONS: Final[str] = """You are a planning progress analyzer. Your task is to analyze progress toward a goal and identify what remains to be done.
 
 INSTRUCTIONS:
 1. **Analyze the goal**: Understand what needs to be accomplished
@@ -568,4 +723,72 @@ Provide your analysis in the following structure:
 Be specific, actionable, and honest about progress. If little has been done, say so. If significant progress has been made, acknowledge it.
 """
 
-    return prompt
+_PLANNING_PROCESSOR_TASK_TEMPLATE: Final[str] = """GOAL (from task name):
+{goal}
+
+{project_info}
+Task Description: {task_description}
+
+{steps_taken_section}
+
+## Web Search Results (for identifying required steps):
+{search_results}
+"""
+
+@lru_cache(maxsize=256)
+def _planning_task_text(
+    goal: str,
+    steps_taken: Tuple[str, ...],
+    task_description: str,
+    project_name: str,
+    search_results: str
+) -> str:
+    """Render the planning processor's user message from hashable inputs; memoized per task."""
+    # Format steps taken section
+    if steps_taken:
+        steps_taken_section = "\n## Steps Taken So Far (from comments):\n" + "".join(
+            f"{i}. {step}\n" for i, step in enumerate(steps_taken, 1)
+        )
+    else:
+        steps_taken_section = "\n## Steps Taken So Far:\nNo steps documented yet in comments.\n"
+
+    # Format project info
+    project_info = f"Project: {project_name}\n" if project_name else ""
+
+    return _PLANNING_PROCESSOR_TASK_TEMPLATE.format_map({
+        "goal": goal,
+        "project_info": project_info,
+        "task_description": task_description if task_description else "None",
+        "steps_taken_section": steps_taken_section,
+        "search_results": search_results if search_results else "No web search results available.",
+    })
+
+
+def get_planning_processor_messages(
+    goal: str,
+    steps_taken: list,
+    task_description: str = "",
+    project_name: str = "",
+    search_results: str = "",
+    cache_control: bool = False
+) -> list:
+    """
+    Creates the planning processor prompt as system + user messages.
+
+    Args:
+        goal: The goal from task name
+        steps_taken: List of steps already completed (from comments)
+        task_description: Optional task description
+        project_name: Optional project name
+        search_results: Web search results for required steps
+        cache_control: Mark the system prefix with Anthropic cache_control
+
+    Returns:
+        List of message dicts accepted by chat model invoke()
+    """
+    return [
+        _system_message(_PLANNING_PROCESSOR_INSTRUCTIONS, cache_control),
+        {"role": "user", "content": _planning_task_text(
+            goal, tuple(steps_taken), task_description, project_name, search_results
+        )},
+    ]
@@ -0,0 +1,165 @@
+"""
+Batch Processor Worker
+Processes all pending tasks up front, before the per-task loop.
+Tasks are grouped by the processor their type routes to; each group is sent
+as one batch() dispatch and the groups run concurrently on a thread pool.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Literal
+from langchain_core.messages import HumanMessage
+from langgraph.types import Command
+
+from helpers.state import State
+from helpers.observability import ExecutionTracker
+from workers.research_processor import process_research_batch
+from workers.next_action_processor import process_next_action_batch
+from workers.learning_processor import process_learning_batch
+from workers.planning_processor import process_planning_batch
+
+
+# Processor each task type is routed to in a batch run
+BATCH_PROCESSOR_FOR_TYPE = {
+    "research": "research_processor",
+    "short": "next_action_processor",
+    "learning": "learning_processor",
+    "abstract": "learning_processor",
+    "planning": "planning_processor",
+}
+
+# Batch entry point of each processor
+BATCH_FUNCTIONS = {
+    "research_processor": process_research_batch,
+    "next_action_processor": process_next_action_batch,
+    "learning_processor": process_learning_batch,
+    "planning_processor": process_planning_batch,
+}
+
+# Maximum concurrent requests per processor batch
+BATCH_MAX_CONCURRENCY = 10
+
+
+def group_tasks_for_batch(state: State) -> Dict[str, List[dict]]:
+    """
+    Group incomplete tasks by the enabled processor their classification routes to.
+
+    Args:
+        state: Current workflow state
+
+    Returns:
+        Dictionary mapping processor name to its pending tasks
+    """
+    task_classifications = state.get("task_classifications", {})
+    task_completion_status = state.get("task_completion_status", {})
+    enabled_agents = state.get("enabled_agents") or list(BATCH_FUNCTIONS)
+
+    groups = {}
+    for task in state.get("todoist_tasks", []):
+        if task_completion_status.get(task['id'], False):
+            continue
+        processor = BATCH_PROCESSOR_FOR_TYPE.get(task_classifications.get(task['id']))
+        if processor in enabled_agents:
+            groups.setdefault(processor, []).append(task)
+
+    return groups
+
+
+def batch_processor_node(state: State) -> Command[Literal["executor"]]:
+    """
+    Process every pending task with one batched LLM dispatch per processor.
+
+    Successfully processed tasks are marked complete for the task loop;
+    failed ones are left for per-task processing.
+
+    Args:
+        state: Current workflow state
+
+    Returns:
+        Command with updated state routing to executor
+    """
+    groups = group_tasks_for_batch(state)
+
+    if not groups:
+        message = HumanMessage(
+            content="No tasks to batch process",
+            name="batch_processor"
+        )
+        return Command(
+            update={"messages": [message]},
+            goto="executor"
+        )
+
+    try:
+        # Start tracking execution
+        exec_event = ExecutionTracker.start_node(
+            node_name="batch_processor",
+            total_tasks=sum(len(tasks) for tasks in groups.values()),
+            mode="batch"
+        )
+
+        updates = _process_groups(groups, state)
+
+        # Deltas only; the state reducers merge the dict fields
+        messages = []
+        processed_results = {}
+        task_context_files = {}
+        learning_task_files = {}
+        task_processing_history = state.get("task_processing_history", {})
+        task_processing_updates = {}
+        task_completion_updates = {}
+
+        for processor, update in zip(groups, updates):
+            if isinstance(update, Exception):
+                # Whole group failed; its tasks fall back to the per-task loop
+                messages.append(HumanMessage(
+                    content=f"Error batch processing {processor} tasks: {str(update)}",
+                    name="batch_processor"
+                ))
+                continue
+
+            messages.extend(update["messages"])
+            processed_results.update(update["processed_results"])
+            task_context_files.update(update.get("task_context_files", {}))
+            learning_task_files.update(update.get("learning_task_files", {}))
+
+            for task_id in update["processed_results"]:
+                task_processing_updates[task_id] = task_processing_history.get(task_id, []) + [processor]
+                task_completion_updates[task_id] = True
+
+        # Finish tracking
+        exec_event.finish()
+        execution_timeline = [exec_event.to_dict()]
+
+        return Command(
+            update={
+                "messages": messages,
+                "processed_results": processed_results,
+                "execution_timeline": execution_timeline,
+                "task_context_files": task_context_files,
+                "learning_task_files": learning_task_files,
+                "task_processing_history": task_processing_updates,
+                "task_completion_status": task_completion_updates,
+            },
+            goto="executor"
+        )
+
+    except Exception as e:
+        error_message = HumanMessage(
+            content=f"Error batch processing tasks: {str(e)}",
+            name="batch_processor"
+        )
+
+        return Command(
+            update={"messages": [error_message]},
+            goto="executor"
+        )
+
+
+def _process_groups(groups: Dict[str, List[dict]], state: State) -> list:
+    """Run every processor's batch concurrently; returns updates (or exceptions) in group order."""
+    with ThreadPoolExecutor(max_workers=len(groups), thread_name_prefix="batch_groups") as pool:
+        futures = [
+            pool.submit(BATCH_FUNCTIONS[processor], tasks, state, BATCH_MAX_CONCURRENCY)
+            for processor, tasks in groups.items()
+        ]
+
+    return [future.exception() or future.result() for future in futures]
@@ -3,216 +3,266 @@ Learning Processor Worker
 Specialized worker for educational and learning tasks with context awareness.
 Tracks progress, resources, and next steps for continuous learning.
 """
-from typing import Literal
-from datetime import datetime
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
 from langchain_core.messages import HumanMessage
-from langgraph.types import Command
+from pydantic import BaseModel, Field
 
+from config.model_factory import get_tracked_chat_model, supports_prompt_caching
 from helpers.state import State
-from helpers.observability import ExecutionTracker, create_enhanced_message_metadata
+from helpers.observability import ExecutionEvent
 from helpers.context_loader import load_context_for_task, format_context_for_prompt
-from helpers.learning_file_manager import create_or_update_learning_task_file
-from prompts.templates import get_processor_prompt, get_next_step_prompt
+from helpers.learning_file_manager import create_or_update_learning_task_file, get_learning_task_filepath
+from prompts.templates import get_learning_processor_messages
+from workers.processor_base import ProcessorConfig, ProcessorOutput, make_processor_node
 
 
-def learning_processor_node(state: State) -> Command[Literal["executor"]]:
+# Learning task files are written in the background so the task loop doesn't
+# wait on disk I/O; markdown_writer flushes them before the run ends
+_FILE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="learning_files")
+_pending_file_writes: Dict[str, Future] = {}  # filepath -> latest queued write
+_pending_lock = threading.Lock()
+
+
+class LearningResult(BaseModel):
+    """Structured output of the learning processor's single LLM call."""
+
+    learning_plan: str = Field(description="Markdown learning plan for the task")
+    next_step: str = Field(description="The single next immediate action, in 1-2 sentences")
+
+
+def _process_learning(task: dict, task_classification: str, state: State, exec_event: ExecutionEvent) -> ProcessorOutput:
     """
-    Process a learning/educational task with context awareness.
+    Create a learning plan and next step for one task with context awareness.
 
-    This worker:
     - Loads learning context (if available) for continuity
     - Creates structured learning plans
     - Tracks progress and resources
     - Suggests next steps
+    """
+    task_id = task['id']
 
-    Supports both task-loop mode (using current_task_id) and legacy mode (using current_task_index).
+    # Load context file if available
+    context_path, context_filename, context_info = _load_learning_context(task)
+    task_context_files = {}
+
+    if context_path and context_info:
+        # Track which context file was used
+        task_context_files[task_id] = context_path
+
+    # Get project name and comments
+    project_id_to_name = state.get("project_id_to_name", {})
+    project_name = project_id_to_name.get(task.get('project_id'), "Unknown Project")
+    comments = task.get('comments', [])
+
+    # Generate learning-specific processing prompt
+    # (static instructions as a cacheable system prefix, task data last)
+    prompt = get_learning_processor_messages(
+        task=task,
+        context=context_info if context_info else None,
+        comments=comments,
+        project_name=project_name,
+        cache_control=supports_prompt_caching(),
+        with_next_step=True
+    )
+
+    # Get learning plan and next step from LLM in one structured call with tracking
+    model = get_tracked_chat_model(
+        node_name="learning_processor",
+        purpose="learning_path_generation",
+        size="large"
+    ).with_structured_output(LearningResult)
+    result = model.invoke(prompt)
+
+    # Create or update learning task markdown file
+    filepath, file_action = _write_learning_file(task, project_name, comments, result)
+
+    # Build result message with context and file info
+    notes_text = _format_notes(context_filename, filepath, file_action)
+
+    return ProcessorOutput(
+        result=result.learning_plan,
+        message=f"Learning plan for '{task['content']}':\n\nNext Step: {result.next_step}{notes_text}",
+        updates={
+            "task_context_files": task_context_files,  # Track context usage
+            "learning_task_files": {task_id: filepath} if filepath else {},  # Track learning task files
+        }
+    )
 
-    Args:
-        state: Current workflow state
 
-    Returns:
-        Command with updated state routing to executor
-    """
-    tasks = state.get("todoist_tasks", [])
-    current_task_index = state.get("current_task_index", 0)
-    current_task_id = state.get("current_task_id")
-    task_classifications = state.get("task_classifications", {})
-
-    # Get the task to process
-    # Priority: use current_task_id if available (task-loop mode), otherwise use index
-    task = None
-    if current_task_id:
-        # Task-loop mode: find task by ID
-        task = next((t for t in tasks if t['id'] == current_task_id), None)
-    elif current_task_index < len(tasks):
-        # Legacy mode: use index
-        task = tasks[current_task_index]
-
-    if not task:
-        error_message = HumanMessage(
-            content="No task available to process",
-            name="learning_processor"
-        )
-        return Command(
-            update={"messages": [error_message]},
-            goto="executor"
-        )
+LEARNING_PROCESSOR = ProcessorConfig(
+    name="learning_processor",
+    default_type="learning",
+    appropriate_types=('learning', 'research', 'abstract'),
+    mismatch_note="which is typically handled by next_action_processor. Processing as learning task anyway...",
+    error_prefix="Error processing learning task",
+    process=_process_learning,
+)
 
-    task_id = task['id']
-    task_classification = task_classifications.get(task_id, "learning")
-
-    # Check if this is an appropriate task type for learning processing
-    appropriate_types = ['learning', 'research', 'abstract']
-    if task_classification not in appropriate_types:
-        warning_message = HumanMessage(
-            content=f"Note: Task '{task['content']}' is classified as '{task_classification}', "
-                    f"which is typically handled by next_action_processor. Processing as learning task anyway...",
-            name="learning_processor"
-        )
+# Process a learning/educational task with context awareness
+learning_processor_node = make_processor_node(LEARNING_PROCESSOR)
 
-    try:
-        # Start tracking execution
-        exec_event = ExecutionTracker.start_node(
-            node_name="learning_processor",
-            task_id=task_id,
-            task_index=current_task_index if not current_task_id else None,
-            total_tasks=len(tasks)
-        )
 
-        # Load context file if available
-        context_path, context_content = load_context_for_task(task)
+def process_learning_batch(tasks: List[dict], state: State, max_concurrency: int) -> dict:
+    """
+    Process several learning/abstract tasks with one batched LLM dispatch.
+
+    Builds one prompt per task and sends them together via model.batch(), so
+    N learning tasks cost roughly one round trip instead of N serial ones.
+    Tasks whose call failed are left out of processed_results so the task
+    loop processes them individually.
 
-        context_info = ""
-        task_context_files = state.get("task_context_files", {})
+    Args:
+        tasks: Tasks to process
+        state: Current workflow state
+        max_concurrency: Maximum concurrent LLM requests
 
-        if context_path and context_content:
-            # Track which context file was used
-            task_context_files[task_id] = context_path
-            context_info = format_context_for_prompt(context_content, "Learning")
+    Returns:
+        Partial state update (messages, processed_results, task_context_files,
+        learning_task_files) for the batch processor to merge
+    """
+    project_id_to_name = state.get("project_id_to_name", {})
+    task_context_files = {}
+    cache_control = supports_prompt_caching()
 
-        # Import model factory
-        from config.model_factory import get_tracked_chat_model
+    # Build all prompts up front
+    prepared = []
+    for task in tasks:
+        context_path, context_filename, context_info = _load_learning_context(task)
+        if context_path and context_info:
+            task_context_files[task['id']] = context_path
 
-        # Get project name and comments
-        project_id_to_name = state.get("project_id_to_name", {})
         project_name = project_id_to_name.get(task.get('project_id'), "Unknown Project")
         comments = task.get('comments', [])
-
-        # Generate learning-specific processing prompt
-        prompt = get_processor_prompt(
-            task_type="learning",
+        prompt = get_learning_processor_messages(
             task=task,
             context=context_info if context_info else None,
             comments=comments,
-            project_name=project_name
+            project_name=project_name,
+            cache_control=cache_control,
+            with_next_step=True
         )
+        prepared.append((task, context_filename, project_name, comments, prompt))
+
+    # One batched dispatch for all learning tasks
+    model = get_tracked_chat_model(
+        node_name="learning_processor",
+        purpose="learning_path_generation_batch",
+        size="large"
+    ).with_structured_output(LearningResult)
+    results = model.batch(
+        [prompt for *_, prompt in prepared],
+        config={"max_concurrency": max_concurrency},
+        return_exceptions=True
+    )
+
+    processed_results = {}
+    learning_task_files = {}
+    messages = []
+
+    for (task, context_filename, project_name, comments, _), result in zip(prepared, results):
+        task_id = task['id']
+
+        if isinstance(result, Exception):
+            # Leave the task for the per-task loop to retry
+            messages.append(HumanMessage(
+                content=f"Error batch processing learning task '{task['content']}': {str(result)}",
+                name="learning_processor"
+            ))
+            continue
+
+        filepath, file_action = _write_learning_file(task, project_name, comments, result)
+
+        processed_results[task_id] = result.learning_plan
+        if filepath:
+            learning_task_files[task_id] = filepath
 
-        # Get learning plan from LLM with tracking (FIRST LLM CALL)
-        model = get_tracked_chat_model(
-            node_name="learning_processor",
-            purpose="learning_path_generation"
-        )
-        response = model.invoke(prompt)
-        learning_output = response.content if hasattr(response, 'content') else str(response)
+        notes_text = _format_notes(context_filename, filepath, file_action)
+        messages.append(HumanMessage(
+            content=f"Learning plan for '{task['content']}':\n\nNext Step: {result.next_step}{notes_text}",
+            name="learning_processor"
+        ))
 
-        # Generate next immediate step (SECOND LLM CALL)
-        next_step_prompt = get_next_step_prompt(
-            task=task,
-            learning_plan=learning_output,
-            comments=comments,
-            context=context_info if context_info else None
-        )
+    return {
+        "messages": messages,
+        "processed_results": processed_results,
+        "task_context_files": task_context_files,
+        "learning_task_files": learning_task_files,
+    }
 
-        next_step_model = get_tracked_chat_model(
-            node_name="learning_processor",
-            purpose="next_step_generation"
-        )
-        next_step_response = next_step_model.invoke(next_step_prompt)
-        next_step = next_step_response.content if hasattr(next_step_response, 'content') else str(next_step_response)
 
-        # Create or update learning task markdown file
-        try:
-            filepath, is_new = create_or_update_learning_task_file(
-                task=task,
-                project_name=project_name,
-                comments=comments,
-                learning_plan=learning_output,
-                next_step=next_step
+def _load_learning_context(task: dict) -> Tuple[Optional[str], Optional[str], str]:
+    """Load and format the learning context for a task (path, filename, formatted text)."""
+    context_path, context_filename, context_content = load_context_for_task(task)
+
+    if context_path and context_content:
+        return context_path, context_filename, format_context_for_prompt(context_content, "Learning")
+    return context_path, context_filename, ""
+
+
+def _write_learning_file(task: dict, project_name: str, comments: List[dict], result: LearningResult) -> Tuple[Optional[str], str]:
+    """Queue a create/update of the task's learning file; returns (filepath, action description)."""
+    try:
+        filepath = get_learning_task_filepath(task)
+
+        with _pending_lock:
+            previous = _pending_file_writes.get(filepath)
+            is_new = previous is None and not os.path.exists(filepath)
+            _pending_file_writes[filepath] = _FILE_POOL.submit(
+                _write_after, previous, task, project_name, comments, result
             )
-            file_action = "Created" if is_new else "Updated"
-        except Exception as e:
-            filepath = None
-            file_action = f"Error creating file: {str(e)}"
-
-        # Finish tracking
-        exec_event.finish()
-        execution_timeline = state.get("execution_timeline", [])
-        execution_timeline.append(exec_event.to_dict())
-
-        # Create result message with metadata
-        metadata = create_enhanced_message_metadata(
-            node_name="learning_processor",
-            task_id=task_id,
-            task_index=current_task_index if not current_task_id else state.get("current_task_index"),
-            total_tasks=len(tasks),
-            execution_duration=exec_event.duration_seconds,
-            task_type=task_classification
-        )
 
-        # Build result message with context and file info
-        import os
-        notes = []
+        return filepath, "Created" if is_new else "Updated"
+    except Exception as e:
+        return None, f"Error creating file: {str(e)}"
 
-        if context_path:
-            context_filename = os.path.basename(context_path)
-            notes.append(f"Used context from {context_filename}")
 
-        if filepath:
-            filename = os.path.basename(filepath)
-            notes.append(f"{file_action} learning task file: {filename}")
+def _write_after(previous: Optional[Future], task: dict, project_name: str, comments: List[dict], result: LearningResult) -> Tuple[str, bool]:
+    """Write a learning file once any earlier queued write to the same file has finished."""
+    if previous is not None:
+        wait([previous])
 
-        notes_text = "\n\n*" + " | ".join(notes) + "*" if notes else ""
+    return create_or_update_learning_task_file(
+        task=task,
+        project_name=project_name,
+        comments=comments,
+        learning_plan=result.learning_plan,
+        next_step=result.next_step
+    )
 
-        result_message = HumanMessage(
-            content=f"Learning plan for '{task['content']}':\n\nNext Step: {next_step}{notes_text}",
-            name="learning_processor"
-        )
 
-        # Update processed results
-        processed_results = state.get("processed_results", {})
-        processed_results[task_id] = learning_output
+def flush_learning_file_writes() -> List[str]:
+    """
+    Wait for all queued learning file writes to finish.
 
-        # Track learning task files
-        learning_task_files = state.get("learning_task_files", {})
-        if filepath:
-            learning_task_files[task_id] = filepath
+    Returns:
+        One error message per write that failed (empty if all succeeded)
+    """
+    with _pending_lock:
+        pending = list(_pending_file_writes.items())
+        _pending_file_writes.clear()
 
-        # Note: In task-loop mode, the executor handles incrementing current_task_index
-        # Only increment in legacy mode (when current_task_id is not set)
-        update_dict = {
-            "messages": [result_message],
-            "processed_results": processed_results,
-            "execution_timeline": execution_timeline,
-            "task_context_files": task_context_files,  # Track context usage
-            "learning_task_files": learning_task_files,  # Track learning task files
-        }
+    errors = []
+    for filepath, future in pending:
+        try:
+            future.result()
+        except Exception as e:
+            errors.append(f"Error writing learning task file {os.path.basename(filepath)}: {str(e)}")
 
-        if not current_task_id:
-            # Legacy mode: increment index
-            update_dict["current_task_index"] = current_task_index + 1
+    return errors
 
-        return Command(
-            update=update_dict,
-            goto="executor"
-        )
 
-    except Exception as e:
-        error_message = HumanMessage(
-            content=f"Error processing learning task: {str(e)}",
-            name="learning_processor"
-        )
+def _format_notes(context_filename: Optional[str], filepath: Optional[str], file_action: str) -> str:
+    """Build the italic context/file footnote appended to result messages."""
+    notes = []
 
-        return Command(
-            update={"messages": [error_message]},
-            goto="executor"
-        )
+    if context_filename:
+        notes.append(f"Used context from {context_filename}")
+
+    if filepath:
+        filename = os.path.basename(filepath)
+        notes.append(f"{file_action} learning task file: {filename}")
+
+    return "\n\n*" + " | ".join(notes) + "*" if notes else ""
@@ -10,6 +10,21 @@ from langgraph.types import Command
 
 from config.config import OUTPUT_DIR
 from helpers.state import State
+from workers.learning_processor import flush_learning_file_writes
+
+
+# One report section per task, filled with str.format_map
+_TASK_TEMPLATE = (
+    "## {i}. {content}\n\n"
+    "**Type:** {task_type}\n\n"
+    "**Project:** {project_name}\n\n"
+    "{desc_block}{labels_block}"
+    "**Due Date:** {due_date}\n\n"
+    "**Priority:** {priority}\n\n"
+    "### Processing Result:\n\n"
+    "{result}\n\n"
+    "---\n\n"
+)
 
 
 def markdown_writer_node(state: State) -> Command[Literal["__end__"]]:
@@ -27,64 +42,67 @@ def markdown_writer_node(state: State) -> Command[Literal["__end__"]]:
     processed_results = state.get("processed_results", {})
     project_id_to_name = state.get("project_id_to_name", {})
 
+    # Make sure background learning file writes have landed before finishing
+    flush_messages = [
+        HumanMessage(content=error, name="markdown_writer")
+        for error in flush_learning_file_writes()
+    ]
+
     if not tasks:
         error_message = HumanMessage(
             content="No tasks available to generate report",
             name="markdown_writer"
         )
         return Command(
-            update={"messages": [error_message]},
+            update={"messages": flush_messages + [error_message]},
             goto="__end__"
         )
 
     try:
-        # Create markdown content
-        today = datetime.now().strftime("%Y-%m-%d")
-        markdown = f"# Task Processing Report - {today}\n\n"
-        markdown += f"**Total Tasks:** {len(tasks)}\n\n"
-        markdown += "---\n\n"
-
-        # Add each task with its processing result
-        for i, task in enumerate(tasks, 1):
-            task_id = task['id']
-            task_type = classifications.get(task_id, "unclassified")
-            result = processed_results.get(task_id, "Not yet processed")
-            project_name = project_id_to_name.get(task['project_id'], "Unknown Project")
-
-            markdown += f"## {i}. {task['content']}\n\n"
-            markdown += f"**Type:** {task_type}\n\n"
-            markdown += f"**Project:** {project_name}\n\n"
-
-            if task['description']:
-                markdown += f"**Description:** {task['description']}\n\n"
-
-            if task['labels']:
-                markdown += f"**Labels:** {', '.join(task['labels'])}\n\n"
-
-            markdown += f"**Due Date:** {task['due_date']}\n\n"
-            markdown += f"**Priority:** {task['priority']}\n\n"
-
-            markdown += f"### Processing Result:\n\n"
-            markdown += f"{result}\n\n"
-            markdown += "---\n\n"
-
         # Ensure output directory exists
         os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-        # Save to file
-        filename = f"task_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+        # Stream the report to disk one section at a time
+        # One timestamp so the title date and filename always agree
+        now = datetime.now()
+        today = now.strftime("%Y-%m-%d")
+        filename = f"task_report_{now.strftime('%Y%m%d_%H%M%S')}.md"
         filepath = os.path.join(OUTPUT_DIR, filename)
 
-        with open(filepath, 'w') as f:
-            f.write(markdown)
-
+        with open(filepath, 'w', buffering=1 << 16) as f:
+            f.write(f"# Task Processing Report - {today}\n\n")
+            f.write(f"**Total Tasks:** {len(tasks)}\n\n")
+            f.write("---\n\n")
+
+            # Add each task with its processing result
+            for i, task in enumerate(tasks, 1):
+                task_id = task['id']
+                description = task['description']
+                labels = task['labels']
+
+                f.write(_TASK_TEMPLATE.format_map({
+                    "i": i,
+                    "content": task['content'],
+                    "task_type": classifications.get(task_id, "unclassified"),
+                    "project_name": project_id_to_name.get(task['project_id'], "Unknown Project"),
+                    "desc_block": f"**Description:** {description}\n\n" if description else "",
+                    "labels_block": f"**Labels:** {', '.join(labels)}\n\n" if labels else "",
+                    "due_date": task['due_date'],
+                    "priority": task['priority'],
+                    "result": processed_results.get(task_id, "Not yet processed"),
+                }))
+
+        # The report itself stays on disk; state only carries its path
         result_message = HumanMessage(
-            content=f"Generated markdown report: {filepath}\n\n{markdown}",
+            content=f"Generated markdown report: {filepath} ({len(tasks)} tasks)",
             name="markdown_writer"
         )
 
         return Command(
-            update={"messages": [result_message]},
+            update={
+                "messages": flush_messages + [result_message],
+                "report_path": filepath,
+            },
             goto="__end__"
         )
 
@@ -95,6 +113,6 @@ def markdown_writer_node(state: State) -> Command[Literal["__end__"]]:
         )
 
         return Command(
-            update={"messages": [error_message]},
+            update={"messages": flush_messages + [error_message]},
             goto="__end__"
         )
@@ -2,111 +2,111 @@
 Next Action Processor Worker
 Suggests immediate next actionable step for short tasks.
 """
-from typing import Literal
+from typing import List
 from langchain_core.messages import HumanMessage
-from langgraph.types import Command
 
+from config.model_factory import get_tracked_chat_model, supports_prompt_caching
 from helpers.state import State
-from prompts.templates import get_processor_prompt
-
-
-def next_action_processor_node(state: State) -> Command[Literal["executor"]]:
+from helpers.observability import ExecutionEvent
+from helpers.streaming import stream_llm_text
+from prompts.templates import get_processor_messages
+from workers.processor_base import ProcessorConfig, ProcessorOutput, make_processor_node
+
+
+def _process_next_action(task: dict, task_classification: str, state: State, exec_event: ExecutionEvent) -> ProcessorOutput:
+    """Suggest the next action for one short/planning task."""
+    # Determine appropriate processor type based on classification
+    processor_type = task_classification if task_classification in ['short', 'planning'] else 'short'
+
+    # Generate processing prompt (static instructions as a cacheable system prefix)
+    prompt = get_processor_messages(processor_type, task, cache_control=supports_prompt_caching())
+
+    # Get next action from LLM, streaming chunks to any connected UI
+    # (one-sentence replies for short tasks, so use the small model)
+    model = get_tracked_chat_model(
+        node_name="next_action_processor",
+        purpose="next_action",
+        size="small" if processor_type == "short" else "large"
+    )
+    next_action = stream_llm_text(
+        model, prompt, node_name="next_action_processor", task_id=task['id'], exec_event=exec_event
+    )
+
+    return ProcessorOutput(
+        result=next_action,
+        message=f"Next action for '{task['content']}':\n{next_action}"
+    )
+
+
+NEXT_ACTION_PROCESSOR = ProcessorConfig(
+    name="next_action_processor",
+    default_type="short",
+    appropriate_types=('short', 'planning'),
+    mismatch_note="which is typically handled by research_processor. Processing anyway...",
+    error_prefix="Error processing task",
+    process=_process_next_action,
+)
+
+# Process a short/planning task and suggest next action
+next_action_processor_node = make_processor_node(NEXT_ACTION_PROCESSOR)
+
+
+def process_next_action_batch(tasks: List[dict], state: State, max_concurrency: int) -> dict:
     """
-    Process a short/planning task and suggest next action.
+    Suggest next actions for several short/planning tasks with one batched LLM dispatch.
 
-    Supports both task-loop mode (using current_task_id) and legacy mode (using current_task_index).
+    Tasks whose call failed are left out of processed_results so the task
+    loop processes them individually.
 
     Args:
+        tasks: Tasks to process
         state: Current workflow state
+        max_concurrency: Maximum concurrent LLM requests
 
     Returns:
-        Command with updated state routing to executor
+        Partial state update (messages, processed_results) for the batch processor to merge
     """
-    tasks = state.get("todoist_tasks", [])
-    current_task_index = state.get("current_task_index", 0)
-    current_task_id = state.get("current_task_id")
     task_classifications = state.get("task_classifications", {})
 
-    # Get the task to process
-    # Priority: use current_task_id if available (task-loop mode), otherwise use index
-    task = None
-    if current_task_id:
-        # Task-loop mode: find task by ID
-        task = next((t for t in tasks if t['id'] == current_task_id), None)
-    elif current_task_index < len(tasks):
-        # Legacy mode: use index
-        task = tasks[current_task_index]
-
-    if not task:
-        error_message = HumanMessage(
-            content="No task available to process",
-            name="next_action_processor"
-        )
-        return Command(
-            update={"messages": [error_message]},
-            goto="executor"
-        )
-
-    task_id = task['id']
-    task_classification = task_classifications.get(task_id, "short")
-
-    # Check if this is an appropriate task type for next action processing
-    appropriate_types = ['short', 'planning']
-    if task_classification not in appropriate_types:
-        warning_message = HumanMessage(
-            content=f"Note: Task '{task['content']}' is classified as '{task_classification}', "
-                    f"which is typically handled by research_processor. Processing anyway...",
-            name="next_action_processor"
-        )
-
-    try:
-        # Import model factory
-        from config.model_factory import get_chat_model
+    cache_control = supports_prompt_caching()
 
-        # Determine appropriate processor type based on classification
+    prompts = []
+    processor_types = set()
+    for task in tasks:
+        task_classification = task_classifications.get(task['id'], "short")
         processor_type = task_classification if task_classification in ['short', 'planning'] else 'short'
+        processor_types.add(processor_type)
+        prompts.append(get_processor_messages(processor_type, task, cache_control=cache_control))
+
+    # Small model only when every reply is a one-sentence next action
+    model = get_tracked_chat_model(
+        node_name="next_action_processor",
+        purpose="next_action_batch",
+        size="small" if processor_types == {"short"} else "large"
+    )
+    responses = model.batch(
+        prompts,
+        config={"max_concurrency": max_concurrency},
+        return_exceptions=True
+    )
+
+    processed_results = {}
+    messages = []
+
+    for task, response in zip(tasks, responses):
+        if isinstance(response, Exception):
+            # Leave the task for the per-task loop to retry
+            messages.append(HumanMessage(
+                content=f"Error batch processing task '{task['content']}': {str(response)}",
+                name="next_action_processor"
+            ))
+            continue
 
-        # Generate processing prompt
-        prompt = get_processor_prompt(processor_type, task)
-
-        # Get next action from LLM
-        model = get_chat_model()
-        response = model.invoke(prompt)
         next_action = response.content if hasattr(response, 'content') else str(response)
-
-        # Create result message
-        result_message = HumanMessage(
+        processed_results[task['id']] = next_action
+        messages.append(HumanMessage(
             content=f"Next action for '{task['content']}':\n{next_action}",
             name="next_action_processor"
-        )
-
-        # Update processed results
-        processed_results = state.get("processed_results", {})
-        processed_results[task_id] = next_action
-
-        # Note: In task-loop mode, the executor handles incrementing current_task_index
-        # Only increment in legacy mode (when current_task_id is not set)
-        update_dict = {
-            "messages": [result_message],
-            "processed_results": processed_results,
-        }
-
-        if not current_task_id:
-            # Legacy mode: increment index
-            update_dict["current_task_index"] = current_task_index + 1
-
-        return Command(
-            update=update_dict,
-            goto="executor"
-        )
-
-    except Exception as e:
-        error_message = HumanMessage(
-            content=f"Error processing task: {str(e)}",
-            name="next_action_processor"
-        )
+        ))
 
-        return Command(
-            update={"messages": [error_message]},
-            goto="executor"
-        )
+    return {"messages": messages, "processed_results": processed_results}
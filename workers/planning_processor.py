@@ -3,171 +3,227 @@ Planning Processor Worker
 Processes planning tasks by analyzing progress, researching required steps, and comparing with completed work.
 Uses web search to identify what steps are needed to reach the goal.
 """
-from typing import Literal
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, List, Optional
 from langchain_core.messages import HumanMessage
-from langgraph.types import Command
 
+from config.model_factory import get_tracked_chat_model, supports_prompt_caching
 from helpers.state import State
-from helpers.observability import ExecutionTracker, create_enhanced_message_metadata
-from prompts.templates import get_planning_processor_prompt
+from helpers.observability import ExecutionEvent
+from helpers.streaming import stream_llm_text
+from prompts.templates import get_planning_processor_messages
+from workers.processor_base import ProcessorConfig, ProcessorOutput, make_processor_node
 
 
-def planning_processor_node(state: State) -> Command[Literal["executor"]]:
+# Web searches run here so they overlap with prompt preparation
+_SEARCH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="web_search")
+
+
+def _process_planning(task: dict, task_classification: str, state: State, exec_event: ExecutionEvent) -> ProcessorOutput:
     """
-    Process a planning task with progress analysis and web search.
+    Analyze progress on one planning task with web search.
 
-    This worker:
     - Extracts goal from task name
     - Analyzes steps taken so far from comments
     - Uses web search to identify required steps
     - Compares progress with required steps
     - Creates summary of done vs remaining
+    """
+    # Extract goal from task name (task content)
+    goal = task['content']
+
+    # Start the web search for required steps; it runs while the rest is prepared
+    search_future = _SEARCH_POOL.submit(perform_web_search, _search_query(goal))
+
+    # Get project name and comments
+    project_id_to_name = state.get("project_id_to_name", {})
+    project_name = project_id_to_name.get(task.get('project_id'), "Unknown Project")
+    comments = task.get('comments', [])
+
+    # Extract steps taken so far from comments
+    steps_taken = []
+    for comment in comments:
+        content = comment.get('content', '').strip()
+        if content:
+            steps_taken.append(content)
+
+    model = get_tracked_chat_model(
+        node_name="planning_processor",
+        purpose="planning_analysis",
+        size="large"
+    )
+
+    search_results = search_future.result()
+
+    # Generate planning analysis prompt (static instructions as a cacheable system prefix)
+    prompt = get_planning_processor_messages(
+        goal=goal,
+        steps_taken=steps_taken,
+        task_description=task.get('description', ''),
+        project_name=project_name,
+        search_results=search_results,
+        cache_control=supports_prompt_caching()
+    )
+
+    # Get planning analysis from LLM with tracking, streaming chunks to any connected UI
+    planning_analysis = stream_llm_text(
+        model, prompt, node_name="planning_processor", task_id=task['id'], exec_event=exec_event
+    )
+
+    return ProcessorOutput(
+        result=planning_analysis,
+        message=f"Planning analysis for '{goal}':\n\n{planning_analysis}"
+    )
+
+
+PLANNING_PROCESSOR = ProcessorConfig(
+    name="planning_processor",
+    default_type="planning",
+    appropriate_types=('planning',),
+    mismatch_note="which is typically handled by other processors. Processing as planning task anyway...",
+    error_prefix="Error processing planning task",
+    process=_process_planning,
+)
+
+# Process a planning task with progress analysis and web search
+planning_processor_node = make_processor_node(PLANNING_PROCESSOR)
+
+
+def process_planning_batch(tasks: List[dict], state: State, max_concurrency: int) -> dict:
+    """
+    Analyze progress on several planning tasks with one batched LLM dispatch.
 
-    Supports both task-loop mode (using current_task_id) and legacy mode (using current_task_index).
+    All web searches run concurrently on the search pool, so they neither
+    wait on each other nor stall the other processors' batches. Tasks whose
+    call failed are left out of processed_results so the task loop processes
+    them individually.
 
     Args:
+        tasks: Tasks to process
         state: Current workflow state
+        max_concurrency: Maximum concurrent LLM requests
 
     Returns:
-        Command with updated state routing to executor
+        Partial state update (messages, processed_results) for the batch processor to merge
     """
-    tasks = state.get("todoist_tasks", [])
-    current_task_index = state.get("current_task_index", 0)
-    current_task_id = state.get("current_task_id")
-    task_classifications = state.get("task_classifications", {})
-
-    # Get the task to process
-    # Priority: use current_task_id if available (task-loop mode), otherwise use index
-    task = None
-    if current_task_id:
-        # Task-loop mode: find task by ID
-        task = next((t for t in tasks if t['id'] == current_task_id), None)
-    elif current_task_index < len(tasks):
-        # Legacy mode: use index
-        task = tasks[current_task_index]
-
-    if not task:
-        error_message = HumanMessage(
-            content="No task available to process",
-            name="planning_processor"
-        )
-        return Command(
-            update={"messages": [error_message]},
-            goto="executor"
-        )
-
-    task_id = task['id']
-    task_classification = task_classifications.get(task_id, "planning")
-
-    # Check if this is an appropriate task type for planning processing
-    appropriate_types = ['planning']
-    if task_classification not in appropriate_types:
-        warning_message = HumanMessage(
-            content=f"Note: Task '{task['content']}' is classified as '{task_classification}', "
-                    f"which is typically handled by other processors. Processing as planning task anyway...",
-            name="planning_processor"
-        )
-
-    try:
-        # Start tracking execution
-        exec_event = ExecutionTracker.start_node(
-            node_name="planning_processor",
-            task_id=task_id,
-            task_index=current_task_index if not current_task_id else None,
-            total_tasks=len(tasks)
-        )
-
-        # Import model factory
-        from config.model_factory import get_tracked_chat_model
-
-        # Get project name and comments
-        project_id_to_name = state.get("project_id_to_name", {})
-        project_name = project_id_to_name.get(task.get('project_id'), "Unknown Project")
-        comments = task.get('comments', [])
-
-        # Extract goal from task name (task content)
-        goal = task['content']
-
-        # Extract steps taken so far from comments
-        steps_taken = []
-        for comment in comments:
-            content = comment.get('content', '').strip()
-            if content:
-                steps_taken.append(content)
+    project_id_to_name = state.get("project_id_to_name", {})
+    cache_control = supports_prompt_caching()
 
-        # Perform web search to identify required steps
-        search_query = f"how to {goal} step by step guide checklist"
-        search_results = perform_web_search(search_query)
+    all_search_results = list(_SEARCH_POOL.map(
+        perform_web_search, (_search_query(task['content']) for task in tasks)
+    ))
 
-        # Generate planning analysis prompt
-        prompt = get_planning_processor_prompt(
+    prompts = []
+    for task, search_results in zip(tasks, all_search_results):
+        goal = task['content']
+        steps_taken = [
+            content for comment in task.get('comments', [])
+            if (content := comment.get('content', '').strip())
+        ]
+        prompts.append(get_planning_processor_messages(
             goal=goal,
             steps_taken=steps_taken,
             task_description=task.get('description', ''),
-            project_name=project_name,
-            search_results=search_results
-        )
-
-        # Get planning analysis from LLM with tracking
-        model = get_tracked_chat_model(
-            node_name="planning_processor",
-            purpose="planning_analysis"
-        )
-        response = model.invoke(prompt)
-        planning_analysis = response.content if hasattr(response, 'content') else str(response)
+            project_name=project_id_to_name.get(task.get('project_id'), "Unknown Project"),
+            search_results=search_results,
+            cache_control=cache_control
+        ))
+
+    model = get_tracked_chat_model(
+        node_name="planning_processor",
+        purpose="planning_analysis_batch",
+        size="large"
+    )
+    responses = model.batch(
+        prompts,
+        config={"max_concurrency": max_concurrency},
+        return_exceptions=True
+    )
+
+    processed_results = {}
+    messages = []
+
+    for task, response in zip(tasks, responses):
+        if isinstance(response, Exception):
+            # Leave the task for the per-task loop to retry
+            messages.append(HumanMessage(
+                content=f"Error batch processing planning task '{task['content']}': {str(response)}",
+                name="planning_processor"
+            ))
+            continue
 
-        # Finish tracking
-        exec_event.finish()
-        execution_timeline = state.get("execution_timeline", [])
-        execution_timeline.append(exec_event.to_dict())
-
-        # Create result message with metadata
-        metadata = create_enhanced_message_metadata(
-            node_name="planning_processor",
-            task_id=task_id,
-            task_index=current_task_index if not current_task_id else state.get("current_task_index"),
-            total_tasks=len(tasks),
-            execution_duration=exec_event.duration_seconds,
-            task_type=task_classification
-        )
-
-        result_message = HumanMessage(
-            content=f"Planning analysis for '{goal}':\n\n{planning_analysis}",
+        planning_analysis = response.content if hasattr(response, 'content') else str(response)
+        processed_results[task['id']] = planning_analysis
+        messages.append(HumanMessage(
+            content=f"Planning analysis for '{task['content']}':\n\n{planning_analysis}",
             name="planning_processor"
-        )
+        ))
 
-        # Update processed results
-        processed_results = state.get("processed_results", {})
-        processed_results[task_id] = planning_analysis
+    return {"messages": messages, "processed_results": processed_results}
 
-        # Note: In task-loop mode, the executor handles incrementing current_task_index
-        # Only increment in legacy mode (when current_task_id is not set)
-        update_dict = {
-            "messages": [result_message],
-            "processed_results": processed_results,
-            "execution_timeline": execution_timeline,
-        }
 
-        if not current_task_id:
-            # Legacy mode: increment index
-            update_dict["current_task_index"] = current_task_index + 1
+def _search_query(goal: str) -> str:
+    """Web search query for the steps needed to reach a goal."""
+    return f"how to {goal} step by step guide checklist"
 
-        return Command(
-            update=update_dict,
-            goto="executor"
-        )
 
-    except Exception as e:
-        error_message = HumanMessage(
-            content=f"Error processing planning task: {str(e)}",
-            name="planning_processor"
-        )
+# Returned when neither search package is installed
+_SEARCH_UNAVAILABLE_MESSAGE = "Web search not available. Install 'langchain-community' or 'duckduckgo-search' package for web search capabilities. Analysis will proceed without web search results."
 
-        return Command(
-            update={"messages": [error_message]},
-            goto="executor"
-        )
+
+@lru_cache(maxsize=1)
+def _get_search_backend() -> Optional[Callable[[str, int], str]]:
+    """
+    Resolve the web search backend once and reuse it for every search.
+
+    Prefers DuckDuckGoSearchRun from langchain_community, then the
+    duckduckgo-search package's DDGS client.
+
+    Returns:
+        Function taking (query, max_results) and returning formatted results,
+        or None if no search package is installed
+    """
+    # Try DuckDuckGo search from langchain_community
+    try:
+        from langchain_community.tools import DuckDuckGoSearchRun
+
+        search_tool = DuckDuckGoSearchRun()
+
+        def search(query: str, max_results: int) -> str:
+            results = search_tool.run(f"{query}")
+            # Limit to 2000 chars
+            return str(results)[:2000] if results else "No search results found."
+
+        return search
+    except ImportError:
+        pass
+
+    # Try alternative: duckduckgo-search package
+    try:
+        from duckduckgo_search import DDGS
+
+        ddgs = DDGS()
+
+        def search(query: str, max_results: int) -> str:
+            results = list(ddgs.text(query, max_results=max_results))
+            if not results:
+                return "No search results found."
+            formatted = "\n".join([
+                f"- {r.get('title', '')}: {r.get('body', '')[:200]}"
+                for r in results[:max_results]
+            ])
+            return formatted[:2000]
+
+        return search
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _cached_search(query: str, max_results: int) -> str:
+    """Run a search through the resolved backend; memoized per normalized query (failures aren't cached)."""
+    return _get_search_backend()(query, max_results)
 
 
 def perform_web_search(query: str, max_results: int = 5) -> str:
@@ -182,39 +238,10 @@ def perform_web_search(query: str, max_results: int = 5) -> str:
         Formatted string with search results
     """
     try:
-        # Try DuckDuckGo search from langchain_community
-        try:
-            from langchain_community.tools import DuckDuckGoSearchRun
-            
-            search_tool = DuckDuckGoSearchRun()
-            results = search_tool.run(f"{query}")
-            
-            # Format results
-            if results:
-                # Limit results length
-                formatted_results = str(results)[:2000]  # Limit to 2000 chars
-                return formatted_results
-            else:
-                return "No search results found."
-        except ImportError:
-            # Try alternative: duckduckgo-search package
-            try:
-                from duckduckgo_search import DDGS
-                
-                with DDGS() as ddgs:
-                    results = list(ddgs.text(query, max_results=max_results))
-                    if results:
-                        formatted = "\n".join([
-                            f"- {r.get('title', '')}: {r.get('body', '')[:200]}"
-                            for r in results[:max_results]
-                        ])
-                        return formatted[:2000]
-                    else:
-                        return "No search results found."
-            except ImportError:
-                # Fallback: return message about installing search tools
-                return "Web search not available. Install 'langchain-community' or 'duckduckgo-search' package for web search capabilities. Analysis will proceed without web search results."
-            
+        if _get_search_backend() is None:
+            # Fallback: return message about installing search tools
+            return _SEARCH_UNAVAILABLE_MESSAGE
+        # Normalized so repeated goals across runs hit the cache
+        return _cached_search(" ".join(query.lower().split()), max_results)
     except Exception as e:
         return f"Error performing web search: {str(e)}. Analysis will proceed without web search results."
-
@@ -0,0 +1,142 @@
+"""
+Processor Node Factory
+Shared per-task scaffold for the research, next action, learning and planning processors.
+Each processor supplies a ProcessorConfig; make_processor_node builds its graph node.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Literal, Tuple
+from langchain_core.messages import HumanMessage
+from langgraph.types import Command
+
+from helpers.state import State
+from helpers.observability import ExecutionEvent, ExecutionTracker
+
+
+@dataclass(frozen=True)
+class ProcessorOutput:
+    """What a processor produced for one task."""
+
+    result: str  # Stored in processed_results[task_id]
+    message: str  # Content of the processor's result message
+    updates: Dict[str, Any] = field(default_factory=dict)  # Extra state updates (deltas for reducer fields)
+
+
+@dataclass(frozen=True)
+class ProcessorConfig:
+    """Per-processor settings for make_processor_node."""
+
+    name: str  # Node name; also used for messages and tracking
+    default_type: str  # Classification assumed when the task has none
+    appropriate_types: Tuple[str, ...]  # Classifications this processor is meant for
+    mismatch_note: str  # Note text for tasks outside appropriate_types
+    error_prefix: str  # Prefix of the error message when processing fails
+    # process(task, task_classification, state, exec_event) -> ProcessorOutput
+    process: Callable[[dict, str, State, ExecutionEvent], ProcessorOutput] = field(repr=False)
+
+
+def make_processor_node(config: ProcessorConfig) -> Callable[[State], Command[Literal["executor"]]]:
+    """
+    Build a processor graph node from its config.
+
+    The node supports both task-loop mode (using current_task_id) and legacy
+    mode (using current_task_index), tracks its execution, and returns only
+    this task's entries for the reducer-merged state fields.
+
+    Args:
+        config: The processor's settings and per-task processing function
+
+    Returns:
+        Node function taking the workflow state and routing back to executor
+    """
+    def processor_node(state: State) -> Command[Literal["executor"]]:
+        tasks = state.get("todoist_tasks", [])
+        current_task_index = state.get("current_task_index", 0)
+        current_task_id = state.get("current_task_id")
+        task_classifications = state.get("task_classifications", {})
+
+        # Get the task to process
+        # Priority: use current_task_id if available (task-loop mode), otherwise use index
+        task = None
+        if current_task_id:
+            # Task-loop mode: find task by ID
+            task = state.get("tasks_by_id", {}).get(current_task_id)
+        elif current_task_index < len(tasks):
+            # Legacy mode: use index
+            task = tasks[current_task_index]
+
+        if not task:
+            error_message = HumanMessage(
+                content="No task available to process",
+                name=config.name
+            )
+            return Command(
+                update={"messages": [error_message]},
+                goto="executor"
+            )
+
+        task_id = task['id']
+        task_classification = task_classifications.get(task_id, config.default_type)
+
+        # Check if this is an appropriate task type for this processor;
+        # a mismatch is noted ahead of the result (and of any error)
+        notes = []
+        if task_classification not in config.appropriate_types:
+            notes.append(HumanMessage(
+                content=f"Note: Task '{task['content']}' is classified as '{task_classification}', "
+                        f"{config.mismatch_note}",
+                name=config.name
+            ))
+
+        try:
+            # Start tracking execution
+            exec_event = ExecutionTracker.start_node(
+                node_name=config.name,
+                task_id=task_id,
+                task_index=current_task_index if not current_task_id else None,
+                total_tasks=len(tasks)
+            )
+
+            output = config.process(task, task_classification, state, exec_event)
+
+            # Finish tracking
+            exec_event.finish()
+
+            result_message = HumanMessage(
+                content=output.message,
+                name=config.name
+            )
+
+            # Only this task's entries are returned; the state reducers merge
+            # them into processed_results and append to execution_timeline
+            # Note: In task-loop mode, the executor handles incrementing current_task_index
+            # Only increment in legacy mode (when current_task_id is not set)
+            update_dict = {
+                "messages": notes + [result_message],
+                "processed_results": {task_id: output.result},
+                "execution_timeline": [exec_event.to_dict()],
+                **output.updates,
+            }
+
+            if not current_task_id:
+                # Legacy mode: increment index
+                update_dict["current_task_index"] = current_task_index + 1
+
+            return Command(
+                update=update_dict,
+                goto="executor"
+            )
+
+        except Exception as e:
+            error_message = HumanMessage(
+                content=f"{config.error_prefix}: {str(e)}",
+                name=config.name
+            )
+
+            return Command(
+                update={"messages": notes + [error_message]},
+                goto="executor"
+            )
+
+    processor_node.__name__ = f"{config.name}_node"
+    processor_node.__doc__ = f"Process the current task with {config.name} (built by make_processor_node)."
+    return processor_node
@@ -3,140 +3,107 @@ Research Processor Worker
 Analyzes research tasks and creates research plans.
 Includes execution tracking and LLM call monitoring.
 """
-from typing import Literal
-from datetime import datetime
+from typing import List
 from langchain_core.messages import HumanMessage
-from langgraph.types import Command
 
+from config.model_factory import get_tracked_chat_model, supports_prompt_caching
 from helpers.state import State
-from helpers.observability import ExecutionTracker, create_enhanced_message_metadata
-from prompts.templates import get_processor_prompt
-
-
-def research_processor_node(state: State) -> Command[Literal["executor"]]:
+from helpers.observability import ExecutionEvent
+from helpers.streaming import stream_llm_text
+from prompts.templates import get_processor_messages
+from workers.processor_base import ProcessorConfig, ProcessorOutput, make_processor_node
+
+
+def _process_research(task: dict, task_classification: str, state: State, exec_event: ExecutionEvent) -> ProcessorOutput:
+    """Create a research plan for one task."""
+    # Determine appropriate processor type based on classification
+    processor_type = task_classification if task_classification in ['research', 'learning', 'abstract', 'planning'] else 'research'
+
+    # Generate processing prompt (static instructions as a cacheable system prefix)
+    prompt = get_processor_messages(processor_type, task, cache_control=supports_prompt_caching())
+
+    # Get research plan from LLM with tracking, streaming chunks to any connected UI
+    model = get_tracked_chat_model(
+        node_name="research_processor",
+        purpose=f"{processor_type}_processing",
+        size="large"
+    )
+    research_plan = stream_llm_text(
+        model, prompt, node_name="research_processor", task_id=task['id'], exec_event=exec_event
+    )
+
+    return ProcessorOutput(
+        result=research_plan,
+        message=f"Research plan for '{task['content']}':\n{research_plan}"
+    )
+
+
+RESEARCH_PROCESSOR = ProcessorConfig(
+    name="research_processor",
+    default_type="research",
+    appropriate_types=('research', 'learning', 'abstract'),
+    mismatch_note="which is typically handled by next_action_processor. Processing anyway...",
+    error_prefix="Error processing research task",
+    process=_process_research,
+)
+
+# Process a research task and create research plan
+research_processor_node = make_processor_node(RESEARCH_PROCESSOR)
+
+
+def process_research_batch(tasks: List[dict], state: State, max_concurrency: int) -> dict:
     """
-    Process a research task and create research plan.
+    Process several research tasks with one batched LLM dispatch.
 
-    Supports both task-loop mode (using current_task_id) and legacy mode (using current_task_index).
+    Tasks whose call failed are left out of processed_results so the task
+    loop processes them individually.
 
     Args:
+        tasks: Tasks to process
         state: Current workflow state
+        max_concurrency: Maximum concurrent LLM requests
 
     Returns:
-        Command with updated state routing to executor
+        Partial state update (messages, processed_results) for the batch processor to merge
     """
-    tasks = state.get("todoist_tasks", [])
-    current_task_index = state.get("current_task_index", 0)
-    current_task_id = state.get("current_task_id")
     task_classifications = state.get("task_classifications", {})
 
-    # Get the task to process
-    # Priority: use current_task_id if available (task-loop mode), otherwise use index
-    task = None
-    if current_task_id:
-        # Task-loop mode: find task by ID
-        task = next((t for t in tasks if t['id'] == current_task_id), None)
-    elif current_task_index < len(tasks):
-        # Legacy mode: use index
-        task = tasks[current_task_index]
-
-    if not task:
-        error_message = HumanMessage(
-            content="No task available to process",
-            name="research_processor"
-        )
-        return Command(
-            update={"messages": [error_message]},
-            goto="executor"
-        )
-
-    task_id = task['id']
-    task_classification = task_classifications.get(task_id, "research")
-
-    # Check if this is an appropriate task type for research processing
-    appropriate_types = ['research', 'learning', 'abstract']
-    if task_classification not in appropriate_types:
-        warning_message = HumanMessage(
-            content=f"Note: Task '{task['content']}' is classified as '{task_classification}', "
-                    f"which is typically handled by next_action_processor. Processing anyway...",
-            name="research_processor"
-        )
-
-    try:
-        # Start tracking execution
-        exec_event = ExecutionTracker.start_node(
-            node_name="research_processor",
-            task_id=task_id,
-            task_index=current_task_index if not current_task_id else None,
-            total_tasks=len(tasks)
-        )
+    cache_control = supports_prompt_caching()
 
-        # Import model factory
-        from config.model_factory import get_tracked_chat_model
-
-        # Determine appropriate processor type based on classification
+    prompts = []
+    for task in tasks:
+        task_classification = task_classifications.get(task['id'], "research")
         processor_type = task_classification if task_classification in ['research', 'learning', 'abstract', 'planning'] else 'research'
+        prompts.append(get_processor_messages(processor_type, task, cache_control=cache_control))
+
+    model = get_tracked_chat_model(
+        node_name="research_processor",
+        purpose="research_processing_batch",
+        size="large"
+    )
+    responses = model.batch(
+        prompts,
+        config={"max_concurrency": max_concurrency},
+        return_exceptions=True
+    )
+
+    processed_results = {}
+    messages = []
+
+    for task, response in zip(tasks, responses):
+        if isinstance(response, Exception):
+            # Leave the task for the per-task loop to retry
+            messages.append(HumanMessage(
+                content=f"Error batch processing research task '{task['content']}': {str(response)}",
+                name="research_processor"
+            ))
+            continue
 
-        # Generate processing prompt
-        prompt = get_processor_prompt(processor_type, task)
-
-        # Get research plan from LLM with tracking
-        model = get_tracked_chat_model(
-            node_name="research_processor",
-            purpose=f"{processor_type}_processing"
-        )
-        response = model.invoke(prompt)
         research_plan = response.content if hasattr(response, 'content') else str(response)
-
-        # Finish tracking
-        exec_event.finish()
-        execution_timeline = state.get("execution_timeline", [])
-        execution_timeline.append(exec_event.to_dict())
-
-        # Create result message with metadata
-        metadata = create_enhanced_message_metadata(
-            node_name="research_processor",
-            task_id=task_id,
-            task_index=current_task_index if not current_task_id else state.get("current_task_index"),
-            total_tasks=len(tasks),
-            execution_duration=exec_event.duration_seconds,
-            task_type=task_classification
-        )
-
-        result_message = HumanMessage(
+        processed_results[task['id']] = research_plan
+        messages.append(HumanMessage(
             content=f"Research plan for '{task['content']}':\n{research_plan}",
             name="research_processor"
-        )
-        # Note: LangChain messages don't natively support metadata, but we track it in state
-
-        # Update processed results
-        processed_results = state.get("processed_results", {})
-        processed_results[task_id] = research_plan
-
-        # Note: In task-loop mode, the executor handles incrementing current_task_index
-        # Only increment in legacy mode (when current_task_id is not set)
-        update_dict = {
-            "messages": [result_message],
-            "processed_results": processed_results,
-            "execution_timeline": execution_timeline,
-        }
-
-        if not current_task_id:
-            # Legacy mode: increment index
-            update_dict["current_task_index"] = current_task_index + 1
-
-        return Command(
-            update=update_dict,
-            goto="executor"
-        )
-
-    except Exception as e:
-        error_message = HumanMessage(
-            content=f"Error processing research task: {str(e)}",
-            name="research_processor"
-        )
+        ))
 
-        return Command(
-            update={"messages": [error_message]},
-            goto="executor"
-        )
+    return {"messages": messages, "processed_results": processed_results}
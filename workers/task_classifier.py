@@ -2,15 +2,36 @@
 Task Classifier Worker
 Classifies tasks into types: research, planning, short, learning, or abstract.
 """
-import json
-from typing import Literal
+from typing import List, Literal
 from langchain_core.messages import HumanMessage
 from langgraph.types import Command
+from pydantic import BaseModel, Field
 
+from config.model_factory import get_chat_model
 from helpers.state import State
 from prompts.templates import get_task_classifier_prompt
 
 
+class TaskClassification(BaseModel):
+    """Type assigned to a single task."""
+
+    task_id: str = Field(description="ID of the task, exactly as given")
+    task_type: Literal['research', 'planning', 'short', 'learning', 'abstract']
+
+
+class TaskClassifications(BaseModel):
+    """Structured output of a classifier call."""
+
+    classifications: List[TaskClassification] = Field(description="One entry per task")
+
+
+# Tasks per classifier call; larger lists are sharded into concurrent calls
+CLASSIFIER_CHUNK_SIZE = 20
+
+# Maximum concurrent classifier calls
+CLASSIFIER_MAX_CONCURRENCY = 5
+
+
 def task_classifier_node(state: State) -> Command[Literal["executor"]]:
     """
     Classify each task into its type.
@@ -34,38 +55,49 @@ def task_classifier_node(state: State) -> Command[Literal["executor"]]:
         )
 
     try:
-        # Import model factory
-        from config.model_factory import get_chat_model
-
-        # Generate classification prompt
-        prompt = get_task_classifier_prompt(tasks)
-
-        # Get classification from LLM
-        model = get_chat_model()
-        response = model.invoke(prompt)
-        response_text = response.content if hasattr(response, 'content') else str(response)
+        # Generate one classification prompt per chunk of tasks
+        prompts = [
+            get_task_classifier_prompt(tasks[i:i + CLASSIFIER_CHUNK_SIZE])
+            for i in range(0, len(tasks), CLASSIFIER_CHUNK_SIZE)
+        ]
+
+        # Classify all chunks concurrently; structured output has the provider
+        # return schema-valid classifications, so there is no JSON to parse
+        model = get_chat_model(size="small").with_structured_output(TaskClassifications)
+        responses = model.batch(
+            prompts,
+            config={"max_concurrency": CLASSIFIER_MAX_CONCURRENCY},
+            return_exceptions=True
+        )
 
-        # Parse JSON response
-        # Try to extract JSON from response (in case there's extra text)
-        json_start = response_text.find("{")
-        json_end = response_text.rfind("}") + 1
+        # Merge the chunk results; a failed chunk leaves its tasks unclassified
+        classifications = {}
+        errors = []
+        for response in responses:
+            if isinstance(response, Exception):
+                errors.append(response)
+                continue
+            classifications.update(
+                (item.task_id, item.task_type) for item in response.classifications
+            )
 
-        if json_start >= 0 and json_end > json_start:
-            json_str = response_text[json_start:json_end]
-            classifications = json.loads(json_str)
-        else:
-            raise ValueError("No valid JSON found in response")
+        if errors and not classifications:
+            raise errors[0]
 
         # Create summary message
+        tasks_by_id = state.get("tasks_by_id") or {t['id']: t for t in tasks}
         summary = "Task Classifications:\n"
         for task_id, task_type in classifications.items():
             # Find task content for display
-            task = next((t for t in tasks if t['id'] == task_id), None)
+            task = tasks_by_id.get(task_id)
             if task:
                 summary += f"- {task['content']}: {task_type}\n"
             else:
                 summary += f"- Task {task_id}: {task_type}\n"
 
+        if errors:
+            summary += f"\n{len(errors)} of {len(prompts)} classification batches failed: {str(errors[0])}\n"
+
         result_message = HumanMessage(
             content=summary,
             name="task_classifier"
@@ -2,21 +2,38 @@
 Todoist Task Fetcher Worker
 Fetches today's tasks from the Todoist API.
 """
-from datetime import datetime
-from typing import Literal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Literal, Optional, Tuple
 from todoist_api_python.api import TodoistAPI
 from langchain_core.messages import HumanMessage
 from langgraph.types import Command
 
-from config.config import TODOIST_API_TOKEN
-from helpers.state import State
-from helpers.todoist_helpers import get_task_comments
+from helpers.state import State, TodayTask
+from helpers.todoist_helpers import TODOIST_POOL_SIZE, call_with_retry, get_task_comments, get_todoist_api
+
+
+# Todoist filter query for tasks due today or overdue (applied server-side)
+TODAY_FILTER = "today | overdue"
+
+# Projects rarely change, so the project_id -> name map is reused across runs
+PROJECT_CACHE_TTL_SECONDS = 600
+_project_cache: Optional[Tuple[float, Dict[str, str]]] = None  # (fetched at, mapping)
+_project_cache_lock = threading.Lock()
+
+# Todoist requests run here, at most one per pooled connection of the shared client
+_TODOIST_POOL = ThreadPoolExecutor(max_workers=TODOIST_POOL_SIZE, thread_name_prefix="todoist")
 
 
 def todoist_fetcher_node(state: State) -> Command[Literal["executor"]]:
     """
     Fetch today's tasks from Todoist API.
 
+    The project and task lists are fetched concurrently, then the comments
+    of every task due today are fetched concurrently.
+
     Args:
         state: Current workflow state
 
@@ -24,67 +41,85 @@ def todoist_fetcher_node(state: State) -> Command[Literal["executor"]]:
         Command with updated state routing to executor
     """
     try:
-        # Initialize Todoist API
-        api = TodoistAPI(TODOIST_API_TOKEN)
-
-        # Fetch all projects to create project_id -> name mapping
-        all_projects = api.get_projects()
-        project_id_to_name = {project.id: project.name for project in all_projects}
-
-        # Fetch all active tasks
-        all_tasks = api.get_tasks()
-
-        # Get today's date
-        today = datetime.now().date()
-
-        # Filter for today's tasks
-        today_tasks = []
-        for task in all_tasks:
-            # Check if task has a due date
-            if task.due and task.due.date:
-                task_date = datetime.strptime(task.due.date, "%Y-%m-%d").date()
-
-                # Include tasks due today or overdue
-                if task_date <= today:
-                    # Fetch comments for this task
-                    try:
-                        comments = get_task_comments(task.id)
-                    except Exception:
-                        comments = []  # Fallback to empty list if comment fetch fails
-
-                    today_tasks.append({
-                        "id": task.id,
-                        "content": task.content,
-                        "description": task.description or "",
-                        "labels": task.labels,
-                        "priority": task.priority,
-                        "due_date": task.due.date,
-                        "project_id": task.project_id,
-                        "created_at": task.created_at,
-                        "comments": comments,
-                    })
-
-        # Apply task limit if specified
+        # Shared Todoist API client (pooled connections across runs)
+        api = get_todoist_api()
+
+        # Fetch the project_id -> name mapping (cached) and the tasks due
+        # today or overdue at the same time; Todoist applies the filter, so
+        # only today's tasks come over the wire. Transient errors (429/5xx,
+        # network) are retried with backoff before the fetch is failed
+        projects_future = _TODOIST_POOL.submit(call_with_retry, partial(_get_project_names, api))
+        tasks_future = _TODOIST_POOL.submit(call_with_retry, partial(api.get_tasks, filter=TODAY_FILTER))
+        project_id_to_name, due_tasks = projects_future.result(), tasks_future.result()
+
+        # A task in a project we haven't seen means the cached map is stale
+        if any(task.project_id not in project_id_to_name for task in due_tasks):
+            project_id_to_name = call_with_retry(partial(_get_project_names, api, refresh=True))
+
+        # Apply task limit if specified, before any comments are fetched
+        # (Todoist's task endpoint takes no limit, so this is the earliest point)
         task_limit = state.get("task_limit")
         if task_limit and task_limit > 0:
-            today_tasks = today_tasks[:task_limit]
-
-        # Create result message
-        task_summary = f"Fetched {len(today_tasks)} tasks for today:\n"
-        for i, task in enumerate(today_tasks, 1):
-            task_summary += f"{i}. {task['content']}\n"
-
+            due_tasks = due_tasks[:task_limit]
+
+        # Fetch comments for all of today's tasks concurrently, with the same
+        # retries; a task whose comments still can't be fetched is kept
+        # without them and reported in the result message
+        comment_futures = [
+            _TODOIST_POOL.submit(call_with_retry, partial(get_task_comments, task.id))
+            for task in due_tasks
+        ]
+        all_comments = []
+        comment_errors = []
+        for task, future in zip(due_tasks, comment_futures):
+            error = future.exception()
+            if error is not None:
+                comment_errors.append(f"'{task.content}': {str(error)}")
+            all_comments.append([] if error is not None else future.result())
+
+        today_tasks: List[TodayTask] = [
+            {
+                "id": task.id,
+                "content": task.content,
+                "description": task.description or "",
+                "labels": task.labels,
+                "priority": task.priority,
+                "due_date": task.due.date,
+                "project_id": task.project_id,
+                "created_at": task.created_at,
+                "comments": comments,
+            }
+            for task, comments in zip(due_tasks, all_comments)
+        ]
+
+        # Create result message; the tasks themselves are in todoist_tasks,
+        # so the message (which lands in executor prompts) only has the count
         result_message = HumanMessage(
-            content=task_summary,
+            content=f"Fetched {len(today_tasks)} tasks for today.",
             name="todoist_fetcher"
         )
+        messages = [result_message]
+        if comment_errors:
+            messages.append(HumanMessage(
+                content="Error fetching comments for tasks " + "; ".join(comment_errors),
+                name="todoist_fetcher"
+            ))
+
+        # Only the projects today's tasks belong to go into state; every
+        # consumer looks names up by a task's project_id
+        referenced_projects = {task['project_id'] for task in today_tasks}
 
         # Update state with tasks, project mapping, and message
         return Command(
             update={
-                "messages": [result_message],
+                "messages": messages,
                 "todoist_tasks": today_tasks,
-                "project_id_to_name": project_id_to_name,
+                "tasks_by_id": {task['id']: task for task in today_tasks},
+                "project_id_to_name": {
+                    project_id: project_id_to_name[project_id]
+                    for project_id in referenced_projects
+                    if project_id in project_id_to_name
+                },
                 "current_task_index": 0,
             },
             goto="executor"
@@ -100,3 +135,17 @@ def todoist_fetcher_node(state: State) -> Command[Literal["executor"]]:
             update={"messages": [error_message]},
             goto="executor"
         )
+
+
+def _get_project_names(api: TodoistAPI, refresh: bool = False) -> Dict[str, str]:
+    """Return the project_id -> name map, refetching at most once per PROJECT_CACHE_TTL_SECONDS (or when refresh is set)."""
+    global _project_cache
+
+    with _project_cache_lock:
+        if not refresh and _project_cache and time.monotonic() - _project_cache[0] < PROJECT_CACHE_TTL_SECONDS:
+            return _project_cache[1]
+
+        project_id_to_name = {project.id: project.name for project in api.get_projects()}
+        _project_cache = (time.monotonic(), project_id_to_name)
+        return project_id_to_name
+